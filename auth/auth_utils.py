@@ -129,13 +129,13 @@ def validate_password_strength(password: str) -> tuple[bool, str]:
     if len(password) < 8:
         return False, "Password must be at least 8 characters long"
     
-    if not any(c.isupper() for c in password):
+    if not any(map(str.isupper, password)):
         return False, "Password must contain at least one uppercase letter"
     
-    if not any(c.islower() for c in password):
+    if not any(map(str.islower, password)):
         return False, "Password must contain at least one lowercase letter"
     
-    if not any(c.isdigit() for c in password):
+    if not any(map(str.isdigit, password)):
         return False, "Password must contain at least one digit"
     
     return True, ""
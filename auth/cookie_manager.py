@@ -3,6 +3,7 @@ Secure cookie encryption and storage manager.
 Uses Fernet symmetric encryption to protect YouTube session cookies.
 """
 
+from functools import lru_cache
 from typing import Dict, Optional
 from datetime import datetime, timedelta
 from cryptography.fernet import Fernet, InvalidToken
@@ -14,6 +15,23 @@ from utils.logging_config import get_logger
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=4)
+def get_cipher(encryption_key: bytes) -> Fernet:
+    """
+    Get the Fernet cipher for a key, built once per process.
+    
+    Every CookieManager (app lifespan, user routes, CLI helpers) configured
+    with the same key shares a single cipher instance.
+    
+    Args:
+        encryption_key: Base64-encoded Fernet encryption key
+        
+    Returns:
+        Fernet cipher
+    """
+    return Fernet(encryption_key)
+
+
 class CookieManager:
     """Manages encryption, decryption, and storage of user cookies."""
     
@@ -32,7 +50,7 @@ class CookieManager:
         
         try:
             # Validate and initialize Fernet cipher
-            self.cipher = Fernet(encryption_key.encode() if isinstance(encryption_key, str) else encryption_key)
+            self.cipher = get_cipher(encryption_key.encode() if isinstance(encryption_key, str) else encryption_key)
         except Exception as e:
             logger.error(f"Failed to initialize encryption: {e}")
             raise ConfigurationError(f"Invalid encryption key: {e}")
@@ -3,6 +3,7 @@ Configuration management for YouTube Downloader application.
 Uses pydantic-settings for environment variable loading and validation.
 """
 
+from functools import cached_property
 from pathlib import Path
 from typing import List, Any
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -41,6 +42,18 @@ class Settings(BaseSettings):
         default="sqlite:///./youtube_downloader.db",
         description="Database URL (SQLite or PostgreSQL)"
     )
+    db_pool_size: int = Field(
+        default=5,
+        description="Persistent connections kept in the pool per worker process (server databases only)"
+    )
+    db_max_overflow: int = Field(
+        default=10,
+        description="Extra connections opened under burst load per worker process (server databases only)"
+    )
+    db_statement_cache_size: int = Field(
+        default=1000,
+        description="Compiled SQL statements cached by SQLAlchemy and the SQLite driver"
+    )
     
     # OAuth Configuration
     google_client_id: str = Field(
@@ -145,12 +158,12 @@ class Settings(BaseSettings):
         if self.log_file.parent:
             self.log_file.parent.mkdir(parents=True, exist_ok=True)
     
-    @property
+    @cached_property
     def is_oauth_configured(self) -> bool:
         """Check if OAuth credentials are configured."""
         return bool(self.google_client_id and self.google_client_secret)
     
-    @property
+    @cached_property
     def is_encryption_configured(self) -> bool:
         """Check if cookie encryption is configured."""
         return bool(self.cookie_encryption_key)
@@ -0,0 +1,27 @@
+"""
+Shared pytest fixtures.
+"""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import models  # noqa: F401  (registers every table on Base.metadata)
+from database import Base
+from utils.json import dumps, loads
+
+
+@pytest.fixture
+def session_factory():
+    """Session factory bound to a fresh in-memory SQLite database."""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+        json_serializer=dumps,
+        json_deserializer=loads,
+    )
+    Base.metadata.create_all(bind=engine)
+    yield sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    engine.dispose()
@@ -2,20 +2,44 @@
 Database configuration and session management.
 """
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.schema import CreateIndex
 from config import settings
+from utils.json import dumps, loads
 
 # Database URL - defaults to SQLite, can be changed to PostgreSQL
 DATABASE_URL = getattr(settings, 'database_url', 'sqlite:///./youtube_downloader.db')
 
+IS_SQLITE = DATABASE_URL.startswith('sqlite')
+
+if IS_SQLITE:
+    # Local file: no network connection to go stale, so skip the per-checkout ping;
+    # keep more parsed statements per connection in the driver
+    engine_options = {
+        "connect_args": {
+            "check_same_thread": False,
+            "cached_statements": settings.db_statement_cache_size,
+        },
+        "pool_pre_ping": False,
+    }
+else:
+    engine_options = {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_pre_ping": True,
+    }
+
 # Create engine
 engine = create_engine(
     DATABASE_URL,
-    connect_args={"check_same_thread": False} if DATABASE_URL.startswith('sqlite') else {},
-    pool_pre_ping=True,
-    echo=settings.debug
+    echo=settings.debug,
+    query_cache_size=settings.db_statement_cache_size,
+    json_serializer=dumps,
+    json_deserializer=loads,
+    **engine_options
 )
 
 # Session factory
@@ -37,6 +61,45 @@ def get_db():
         db.close()
 
 
+def upgrade_schema(bind=None):
+    """
+    Apply schema changes that create_all cannot make to existing tables.
+    
+    Each step checks the live schema first, so this is safe to run on every
+    startup and on databases created by the current models.
+    
+    Args:
+        bind: Engine to upgrade (defaults to the application engine)
+    """
+    bind = bind if bind is not None else engine
+    inspector = inspect(bind)
+    
+    # create_all skips tables that already exist, including indexes added to them later
+    # (IF NOT EXISTS also covers expression indexes the SQLite inspector cannot see)
+    with bind.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            if inspector.has_table(table.name):
+                for index in table.indexes:
+                    conn.execute(CreateIndex(index, if_not_exists=True))
+    
+    if bind.dialect.name != "postgresql":
+        return  # SQLite reads the old TEXT columns through the JSON type as-is
+    
+    if not inspector.has_table("audit_logs"):
+        return
+    
+    # audit_logs.details was TEXT holding serialized JSON before it became JSONB
+    column_types = {column['name']: column['type'] for column in inspector.get_columns("audit_logs")}
+    details_type = column_types.get("details")
+    if details_type is not None and not isinstance(details_type, JSONB):
+        with bind.begin() as conn:
+            conn.execute(text(
+                "ALTER TABLE audit_logs ALTER COLUMN details TYPE jsonb "
+                "USING NULLIF(details, '')::jsonb"
+            ))
+
+
 def init_db():
-    """Initialize database tables."""
+    """Initialize database tables and upgrade existing ones."""
     Base.metadata.create_all(bind=engine)
+    upgrade_schema()
@@ -4,12 +4,14 @@ Handles video metadata extraction, downloading, and progress tracking.
 """
 
 import asyncio
+import copy
+import io
 import time
-import os
-import tempfile
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional, Callable, List
+from typing import Dict, Optional, Callable, List, Tuple
 import yt_dlp
+from yt_dlp.cookies import YoutubeDLCookieJar
 from .models import (
     VideoInfoResponse, FormatOption, DownloadRequest,
     ProgressUpdate, DownloadStatus, FormatType
@@ -21,13 +23,39 @@ from utils.logging_config import get_logger
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=8)
+def _parse_cookies(cookie_content: str) -> Tuple:
+    """Parse Netscape cookie file content once per distinct blob."""
+    jar = YoutubeDLCookieJar()
+    jar.load(io.StringIO(cookie_content))
+    return tuple(jar)
+
+
+def build_cookiejar(cookie_content: str) -> YoutubeDLCookieJar:
+    """
+    Build a cookie jar from Netscape cookie file content.
+    
+    Parsing is cached; each call gets its own jar (with copied cookies)
+    because yt-dlp updates the jar while it runs.
+    
+    Args:
+        cookie_content: Raw Netscape cookie file content
+        
+    Returns:
+        Cookie jar for a single YoutubeDL instance
+    """
+    jar = YoutubeDLCookieJar()
+    for cookie in _parse_cookies(cookie_content):
+        jar.set_cookie(copy.copy(cookie))
+    return jar
+
+
 class VideoDownloader:
     """Handles video downloading using yt-dlp."""
     
     def __init__(
         self,
         output_dir: Path,
-        temp_dir: Path,
         max_retries: int = 3,
         timeout: int = 3600
     ):
@@ -36,49 +64,17 @@ class VideoDownloader:
         
         Args:
             output_dir: Directory for completed downloads
-            temp_dir: Directory for temporary files
             max_retries: Maximum retry attempts
             timeout: Download timeout in seconds
         """
         self.output_dir = output_dir
-        self.temp_dir = temp_dir
         self.max_retries = max_retries
         self.timeout = timeout
         
-        # Ensure directories exist
+        # Ensure output directory exists
         self.output_dir.mkdir(parents=True, exist_ok=True)
-        self.temp_dir.mkdir(parents=True, exist_ok=True)
         
-        logger.info(f"VideoDownloader initialized (output: {output_dir}, temp: {temp_dir})")
-    
-    def _create_cookie_file(self, cookie_content: str) -> str:
-        """
-        Create a temporary Netscape cookie file from content.
-        
-        Args:
-            cookie_content: Raw Netscape cookie file content
-            
-        Returns:
-            Path to the temporary file
-        """
-        if not cookie_content:
-            return None
-            
-        fd, path = tempfile.mkstemp(suffix='.txt', dir=str(self.temp_dir), text=True)
-        try:
-            with os.fdopen(fd, 'w', encoding='utf-8') as f:
-                f.write(cookie_content)
-            return path
-        except Exception as e:
-            logger.error(f"Failed to create cookie file: {e}")
-            if os.path.exists(path):
-                try:
-                    os.unlink(path)
-                except:
-                    pass
-            raise
-    
-
+        logger.info(f"VideoDownloader initialized (output: {output_dir})")
     
     def _get_base_ydl_opts(self, cookies: Optional[str] = None) -> Dict:
         """
@@ -143,11 +139,10 @@ class VideoDownloader:
             'allow_unplayable_formats': True,
         })
         
-        cookie_file = None
+        cookiejar = None
         if cookies:
             try:
-                cookie_file = self._create_cookie_file(cookies)
-                ydl_opts['cookiefile'] = cookie_file
+                cookiejar = build_cookiejar(cookies)
             except Exception as e:
                 logger.warning(f"Failed to process cookies: {e}")
         
@@ -158,7 +153,8 @@ class VideoDownloader:
                 None,
                 self._extract_info_sync,
                 url,
-                ydl_opts
+                ydl_opts,
+                cookiejar
             )
             
             # Parse and return info
@@ -185,29 +181,27 @@ class VideoDownloader:
         except Exception as e:
             logger.error(f"Unexpected error getting video info for {url}: {e}")
             raise DownloadError(f"Failed to get video info: {e}", url=url)
-            
-        finally:
-            # Cleanup cookie file
-            if cookie_file and os.path.exists(cookie_file):
-                try:
-                    os.unlink(cookie_file)
-                except Exception as e:
-                    logger.warning(f"Failed to delete temp cookie file: {e}")
-            
-
     
-    def _extract_info_sync(self, url: str, ydl_opts: Dict) -> Dict:
+    def _extract_info_sync(
+        self,
+        url: str,
+        ydl_opts: Dict,
+        cookiejar: Optional[YoutubeDLCookieJar] = None
+    ) -> Dict:
         """
         Synchronous wrapper for yt-dlp extraction.
         
         Args:
             url: Video URL
             ydl_opts: yt-dlp options
+            cookiejar: Optional pre-built cookie jar for authenticated requests
             
         Returns:
             Video info dictionary
         """
         with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            if cookiejar is not None:
+                ydl.cookiejar = cookiejar
             info = ydl.extract_info(url, download=False)
             return info
     
@@ -309,11 +303,10 @@ class VideoDownloader:
                 lambda d: self._progress_hook(d, progress_callback, download_id)
             ]
             
-        cookie_file = None
+        cookiejar = None
         if cookies:
             try:
-                cookie_file = self._create_cookie_file(cookies)
-                ydl_opts['cookiefile'] = cookie_file
+                cookiejar = build_cookiejar(cookies)
             except Exception as e:
                 logger.warning(f"Failed to process cookies: {e}")
         
@@ -324,7 +317,8 @@ class VideoDownloader:
                 None,
                 self._download_sync,
                 url,
-                ydl_opts
+                ydl_opts,
+                cookiejar
             )
             
             # Get output file path
@@ -360,27 +354,27 @@ class VideoDownloader:
                 ))
             
             raise DownloadError(f"Download failed: {e}", url=url)
-            
-        finally:
-            # Cleanup cookie file
-            if cookie_file and os.path.exists(cookie_file):
-                try:
-                    os.unlink(cookie_file)
-                except Exception as e:
-                    logger.warning(f"Failed to delete temp cookie file: {e}")
     
-    def _download_sync(self, url: str, ydl_opts: Dict) -> Dict:
+    def _download_sync(
+        self,
+        url: str,
+        ydl_opts: Dict,
+        cookiejar: Optional[YoutubeDLCookieJar] = None
+    ) -> Dict:
         """
         Synchronous download wrapper.
         
         Args:
             url: Video URL
             ydl_opts: yt-dlp options
+            cookiejar: Optional pre-built cookie jar for authenticated requests
             
         Returns:
             Download result info
         """
         with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            if cookiejar is not None:
+                ydl.cookiejar = cookiejar
             info = ydl.extract_info(url, download=True)
             
             # Get the actual file path
@@ -506,11 +500,10 @@ class VideoDownloader:
             'quiet': True,
         })
         
-        cookie_file = None
+        cookiejar = None
         if cookies:
             try:
-                cookie_file = self._create_cookie_file(cookies)
-                ydl_opts['cookiefile'] = cookie_file
+                cookiejar = build_cookiejar(cookies)
             except Exception as e:
                 logger.warning(f"Failed to process cookies: {e}")
         
@@ -521,7 +514,8 @@ class VideoDownloader:
                 None,
                 self._extract_info_sync,
                 url,
-                ydl_opts
+                ydl_opts,
+                cookiejar
             )
             
             # Parse playlist info
@@ -564,12 +558,3 @@ class VideoDownloader:
         except Exception as e:
             logger.error(f"Unexpected error getting playlist info for {url}: {e}")
             raise DownloadError(f"Failed to get playlist info: {e}", url=url)
-        
-        finally:
-            # Cleanup cookie file
-            if cookie_file and os.path.exists(cookie_file):
-                try:
-                    os.unlink(cookie_file)
-                except Exception as e:
-                    logger.warning(f"Failed to delete temp cookie file: {e}")
-
@@ -0,0 +1,92 @@
+"""
+Database-backed tracking of playlist download batches.
+"""
+
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from sqlalchemy import delete, insert, select
+
+from database import SessionLocal
+from models.playlist_download import PlaylistDownload
+from utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class PlaylistTracker:
+    """
+    Stores which downloads belong to a playlist.
+
+    Only the membership is shared between workers; per-video progress stays
+    in the DownloadQueue of the process that enqueued the playlist.
+    """
+
+    def create(self, playlist_id: str, title: Optional[str], total: int, download_ids: List[str]):
+        """
+        Record a new playlist batch.
+
+        Args:
+            playlist_id: Playlist download identifier
+            title: Playlist title
+            total: Number of videos queued
+            download_ids: Queue download IDs for the videos
+        """
+        with SessionLocal() as db:
+            db.execute(insert(PlaylistDownload).values(
+                playlist_id=playlist_id,
+                title=title,
+                total=total,
+                download_ids=download_ids
+            ))
+            db.commit()
+
+        logger.debug(f"Tracking playlist {playlist_id} with {total} videos")
+
+    def get(self, playlist_id: str) -> Optional[Dict]:
+        """
+        Look up a playlist batch.
+
+        Args:
+            playlist_id: Playlist download identifier
+
+        Returns:
+            Dict with title, total and download_ids, or None if unknown
+        """
+        with SessionLocal() as db:
+            row = db.execute(
+                select(
+                    PlaylistDownload.title,
+                    PlaylistDownload.total,
+                    PlaylistDownload.download_ids
+                ).where(PlaylistDownload.playlist_id == playlist_id)
+            ).first()
+
+        return row._asdict() if row else None
+
+    def cleanup_old(self, max_age_hours: int = 24) -> int:
+        """
+        Delete playlist batches older than the queue keeps their downloads.
+
+        Args:
+            max_age_hours: Remove batches created more than this many hours ago
+
+        Returns:
+            Number of batches removed
+        """
+        threshold = datetime.utcnow() - timedelta(hours=max_age_hours)
+
+        with SessionLocal() as db:
+            result = db.execute(
+                delete(PlaylistDownload).where(PlaylistDownload.created_at < threshold)
+            )
+            db.commit()
+
+        if result.rowcount:
+            logger.info(f"Cleaned up {result.rowcount} old playlist batches")
+
+        return result.rowcount
+
+
+# Global playlist tracker instance
+playlist_tracker = PlaylistTracker()
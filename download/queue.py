@@ -5,7 +5,7 @@ Download queue management for concurrent download handling.
 import asyncio
 import uuid
 from datetime import datetime
-from typing import Dict, Optional, Callable
+from typing import Dict, List, Optional, Callable, Set
 from .models import DownloadRequest, DownloadStatus, ProgressUpdate, DownloadStatusResponse
 from .downloader import VideoDownloader
 from utils.errors import QueueFullError
@@ -46,6 +46,10 @@ class DownloadQueue:
         # Progress tracking {download_id: ProgressUpdate}
         self.progress: Dict[str, ProgressUpdate] = {}
         
+        # Progress listeners {download_id: {queue}}; each queue holds only the latest update
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        
         # Worker tasks
         self.workers: list = []
         
@@ -53,6 +57,7 @@ class DownloadQueue:
     
     async def start_workers(self):
         """Start worker tasks to process queue."""
+        self._loop = asyncio.get_running_loop()
         self.workers = [
             asyncio.create_task(self._worker(i))
             for i in range(self.max_concurrent)
@@ -98,9 +103,10 @@ class DownloadQueue:
                         cookies=cookies
                     )
                     
-                    # Update as completed
+                    # Update as completed; the absolute path is resolved once here
+                    # so serving the file needs a single stat
                     self._update_status(download_id, DownloadStatus.COMPLETED)
-                    self.downloads[download_id]['output_file'] = str(output_file)
+                    self.downloads[download_id]['output_file'] = str(output_file.resolve())
                     # Try to extract filename from path for display
                     self.downloads[download_id]['file_name'] = output_file.name if output_file else None
                     self.downloads[download_id]['completed_at'] = datetime.utcnow().isoformat()
@@ -188,27 +194,26 @@ class DownloadQueue:
         except Exception as e:
             logger.error(f"Failed to save download history: {e}")
 
-    def add_download(
+    def _enqueue(
         self,
         request: DownloadRequest,
-        session_id: Optional[str] = None,
-        cookies: Optional[Dict[str, str]] = None,
-        user_id: Optional[int] = None
+        session_id: Optional[str],
+        cookies: Optional[Dict[str, str]],
+        user_id: Optional[int],
+        created_at: str
     ) -> str:
         """
-        Add download to queue.
+        Register one download's metadata and progress and put it on the queue.
         
         Args:
             request: Download request
             session_id: Session ID
             cookies: Optional cookies for authenticated download
             user_id: User ID for history logging
+            created_at: ISO creation timestamp
             
         Returns:
             Download ID
-            
-        Raises:
-            QueueFullError: If queue is at capacity
         """
         # Generate download ID
         download_id = str(uuid.uuid4())
@@ -220,7 +225,7 @@ class DownloadQueue:
             'user_id': user_id,
             'url': request.url,
             'status': DownloadStatus.PENDING,
-            'created_at': datetime.utcnow().isoformat(),
+            'created_at': created_at,
             'completed_at': None,
             'output_file': None,
             'error': None
@@ -235,10 +240,68 @@ class DownloadQueue:
         
         # Add to queue
         self.queue.put_nowait((download_id, request, cookies))
+        return download_id
+    
+    def add_download(
+        self,
+        request: DownloadRequest,
+        session_id: Optional[str] = None,
+        cookies: Optional[Dict[str, str]] = None,
+        user_id: Optional[int] = None
+    ) -> str:
+        """
+        Add download to queue.
+        
+        Args:
+            request: Download request
+            session_id: Session ID
+            cookies: Optional cookies for authenticated download
+            user_id: User ID for history logging
+            
+        Returns:
+            Download ID
+            
+        Raises:
+            QueueFullError: If queue is at capacity
+        """
+        download_id = self._enqueue(
+            request, session_id, cookies, user_id, datetime.utcnow().isoformat()
+        )
         
         logger.info(f"Added download {download_id} to queue for URL: {request.url}")
         return download_id
     
+    def add_downloads(
+        self,
+        requests: List[DownloadRequest],
+        session_id: Optional[str] = None,
+        cookies: Optional[Dict[str, str]] = None,
+        user_id: Optional[int] = None
+    ) -> List[str]:
+        """
+        Add several downloads sharing the same session, cookies and user.
+        
+        Same bookkeeping as add_download, done in one pass with a single log
+        line instead of one per item (used for playlists).
+        
+        Args:
+            requests: Download requests
+            session_id: Session ID
+            cookies: Optional cookies for authenticated download
+            user_id: User ID for history logging
+            
+        Returns:
+            Download IDs, in request order
+        """
+        created_at = datetime.utcnow().isoformat()
+        download_ids = [
+            self._enqueue(request, session_id, cookies, user_id, created_at)
+            for request in requests
+        ]
+        
+        logger.info(f"Added {len(download_ids)} downloads to queue")
+        return download_ids
+    
     def get_download_status(self, download_id: str) -> Optional[DownloadStatusResponse]:
         """
         Get download status.
@@ -275,6 +338,32 @@ class DownloadQueue:
         """
         return self.progress.get(download_id)
     
+    def get_output_file(self, download_id: str) -> Optional[str]:
+        """
+        Get the absolute path of a completed download's file.
+        
+        Args:
+            download_id: Download identifier
+            
+        Returns:
+            Absolute file path or None if not available
+        """
+        metadata = self.downloads.get(download_id)
+        return metadata.get('output_file') if metadata else None
+    
+    def get_progress_many(self, download_ids: List[str]) -> List[ProgressUpdate]:
+        """
+        Get progress for several downloads at once.
+        
+        Args:
+            download_ids: Download identifiers
+            
+        Returns:
+            Progress updates for the known IDs, in the given order
+        """
+        progress = self.progress
+        return [progress[download_id] for download_id in download_ids if download_id in progress]
+    
     def cancel_download(self, download_id: str) -> bool:
         """
         Cancel a download.
@@ -314,6 +403,8 @@ class DownloadQueue:
         
         if download_id in self.progress:
             self.progress[download_id].status = status
+        
+        self._publish(download_id)
     
     def _update_progress(self, download_id: str, progress: ProgressUpdate):
         """
@@ -328,6 +419,58 @@ class DownloadQueue:
         # Also update status in metadata
         if download_id in self.downloads:
             self.downloads[download_id]['status'] = progress.status
+        
+        self._publish(download_id)
+    
+    def subscribe(self, download_id: str) -> asyncio.Queue:
+        """
+        Listen for progress changes of a download.
+        
+        The returned queue holds at most one item: the latest progress.
+        Intermediate updates a slow listener misses are dropped.
+        
+        Args:
+            download_id: Download identifier
+            
+        Returns:
+            Queue receiving ProgressUpdate objects
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+        self._subscribers.setdefault(download_id, set()).add(queue)
+        return queue
+    
+    def unsubscribe(self, download_id: str, queue: asyncio.Queue):
+        """
+        Stop listening for progress changes.
+        
+        Args:
+            download_id: Download identifier
+            queue: Queue returned by subscribe
+        """
+        listeners = self._subscribers.get(download_id)
+        if listeners is not None:
+            listeners.discard(queue)
+            if not listeners:
+                del self._subscribers[download_id]
+    
+    def _publish(self, download_id: str):
+        """Notify progress listeners; safe to call from yt-dlp's worker threads."""
+        if download_id in self._subscribers and self._loop is not None:
+            try:
+                self._loop.call_soon_threadsafe(self._notify, download_id)
+            except RuntimeError:
+                pass  # Loop already closed during shutdown
+    
+    def _notify(self, download_id: str):
+        """Hand the latest progress to every listener (runs on the event loop)."""
+        progress = self.progress.get(download_id)
+        if progress is None:
+            return
+        
+        for queue in self._subscribers.get(download_id, ()):
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(progress)
     
     def get_queue_size(self) -> int:
         """Get number of pending downloads."""
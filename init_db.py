@@ -4,8 +4,9 @@ Database initialization and seeding.
 
 import sys
 from pathlib import Path
+from sqlalchemy import String, exists, insert, literal, select, union_all
 from sqlalchemy.orm import Session
-from database import engine, Base, SessionLocal
+from database import SessionLocal, init_db
 from models import User, AppSetting, DEFAULT_SETTINGS, UserRole
 from auth.auth_utils import get_password_hash
 import secrets
@@ -17,7 +18,7 @@ logger = get_logger(__name__)
 def init_database():
     """Initialize database tables."""
     logger.info("Creating database tables...")
-    Base.metadata.create_all(bind=engine)
+    init_db()
     logger.info("Database tables created successfully")
 
 
@@ -25,15 +26,24 @@ def seed_default_settings(db: Session):
     """Seed default application settings."""
     logger.info("Checking for default settings...")
     
-    for setting_data in DEFAULT_SETTINGS:
-        existing = db.query(AppSetting).filter(AppSetting.key == setting_data['key']).first()
-        
-        if not existing:
-            setting = AppSetting(**setting_data)
-            db.add(setting)
-            logger.info(f"Added default setting: {setting_data['key']}")
+    # Insert only the missing keys in one statement:
+    # WITH new_vals AS (...) INSERT ... SELECT ... WHERE NOT EXISTS (...) RETURNING key
+    columns = ['key', 'value', 'category', 'description', 'value_type']
+    new_vals = union_all(*(
+        select(*(literal(setting_data[c], String).label(c) for c in columns))
+        for setting_data in DEFAULT_SETTINGS
+    )).cte("new_vals")
+    
+    stmt = insert(AppSetting).from_select(
+        columns,
+        select(new_vals).where(~exists().where(AppSetting.key == new_vals.c.key))
+    ).returning(AppSetting.key)
     
+    inserted_keys = db.execute(stmt).scalars().all()
     db.commit()
+    
+    if inserted_keys:
+        logger.info(f"Added default settings: {', '.join(inserted_keys)}")
     logger.info("Default settings seeded")
 
 
@@ -51,8 +61,8 @@ def create_admin_user(db: Session) -> tuple[str, str]:
         logger.info("Admin user already exists")
         return None, None
     
-    # Generate random password (limit to 16 chars to stay under bcrypt's 72 byte limit)
-    password = secrets.token_urlsafe(12)[:16]  # 12 bytes -> ~16 chars, then truncate to be safe
+    # Generate random password (16 bytes -> 22 URL-safe chars, well under bcrypt's 72 byte limit)
+    password = secrets.token_urlsafe(16)
     
     # Create admin user
     admin = User(
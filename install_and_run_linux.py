@@ -15,6 +15,21 @@ import platform
 from pathlib import Path
 
 
+# ----------------------------
+# Paths (single source of truth)
+# ----------------------------
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+VENV_DIR = SCRIPT_DIR / "venv"
+VENV_PYTHON = VENV_DIR / "bin" / "python"
+
+REQUIREMENTS_FILE = SCRIPT_DIR / "requirements.txt"
+SETUP_SCRIPT = SCRIPT_DIR / "setup.py"
+INIT_DB_SCRIPT = SCRIPT_DIR / "init_db.py"
+MAIN_SCRIPT = SCRIPT_DIR / "main.py"
+ENV_FILE = SCRIPT_DIR / ".env"
+
+
 def print_header(message):
     """Print a formatted header."""
     print("\n" + "=" * 70)
@@ -68,13 +83,12 @@ def create_venv():
     """Create virtual environment."""
     print_step("1", "Creating virtual environment...")
     
-    venv_path = Path("venv")
-    if venv_path.exists():
+    if VENV_DIR.exists():
         print("⚠️  Virtual environment already exists. Skipping creation.")
         return True
     
     try:
-        subprocess.run([sys.executable, "-m", "venv", "venv"], check=True)
+        subprocess.run([sys.executable, "-m", "venv", str(VENV_DIR)], check=True)
         print("✅ Virtual environment created")
         return True
     except subprocess.CalledProcessError as e:
@@ -84,7 +98,7 @@ def create_venv():
 
 def get_venv_python():
     """Get path to Python executable in venv."""
-    return str(Path("venv") / "bin" / "python")
+    return str(VENV_PYTHON)
 
 
 
@@ -94,9 +108,7 @@ def install_dependencies():
 
     python_exe = get_venv_python()
 
-    # Absolute path to requirements.txt (relative to this script)
-    script_dir = Path(__file__).resolve().parent
-    requirements_path = script_dir / "requirements.txt"
+    requirements_path = REQUIREMENTS_FILE
 
     if not requirements_path.exists():
         print(f"❌ requirements.txt not found: {requirements_path}")
@@ -130,14 +142,13 @@ def run_setup():
     print_step("3", "Running setup to generate configuration...")
     
     python_exe = get_venv_python()
-    env_file = Path(".env")
     
-    if env_file.exists():
+    if ENV_FILE.exists():
         print("⚠️  .env file already exists. Skipping setup.")
         return True
     
     try:
-        subprocess.run([python_exe, "setup.py"], check=True)
+        subprocess.run([python_exe, str(SETUP_SCRIPT)], check=True)
         print("✅ Configuration generated")
         return True
     except subprocess.CalledProcessError as e:
@@ -152,7 +163,7 @@ def init_database():
     python_exe = get_venv_python()
     
     try:
-        subprocess.run([python_exe, "init_db.py"], check=True)
+        subprocess.run([python_exe, str(INIT_DB_SCRIPT)], check=True)
         print("✅ Database initialized")
         print("\n⚠️  IMPORTANT: Save the admin credentials shown above!")
         return True
@@ -179,7 +190,7 @@ def start_application():
     
     try:
         # Run the application
-        subprocess.run([python_exe, "main.py"], check=True)
+        subprocess.run([python_exe, str(MAIN_SCRIPT)], check=True)
     except KeyboardInterrupt:
         print("\n\n" + "=" * 70)
         print("  🛑 Application stopped by user")
@@ -242,7 +253,7 @@ def main():
         start_application()
     else:
         print("\n✅ Setup complete! Run the application later with:")
-        print(f"   {get_venv_python()} main.py")
+        print(f"   {get_venv_python()} {MAIN_SCRIPT}")
         print("\n   or simply run this script again.")
 
 
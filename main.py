@@ -40,11 +40,12 @@ if __name__ == "__main__":
 # So we have to place this logic BEFORE `from download.downloader ...`
 
 import asyncio
+import hashlib
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import ORJSONResponse, Response
 from pathlib import Path
 
 from config import settings
@@ -54,6 +55,9 @@ from utils.errors import YouTubeDownloaderError
 # Import database
 from database import init_db
 from models import User
+from utils.audit_writer import audit_writer
+from utils.cleanup_scheduler import cleanup_scheduler
+from utils.pagination import NEXT_CURSOR_HEADER
 
 # Import managers
 from auth.oauth import OAuthManager
@@ -61,6 +65,7 @@ from auth.session import SessionManager
 from auth.cookie_manager import CookieManager
 from download.downloader import VideoDownloader
 from download.queue import DownloadQueue
+from download.playlist_tracker import playlist_tracker
 
 # Import routes
 from routes import video, auth_routes, user_routes, admin_routes
@@ -97,15 +102,20 @@ async def lifespan(app: FastAPI):
         logger.info("Created necessary directories")
 
         # Ensure default settings
-        from models.settings import ensure_default_settings
+        from models.settings import ensure_default_settings, settings_cache
         from database import SessionLocal
         db = SessionLocal()
         try:
              ensure_default_settings(db)
+             settings_cache.load(db)
         finally:
              db.close()
         logger.info("Checked default settings")
         
+        # Load HTML pages into memory
+        app.state.pages = load_pages(STATIC_PAGES)
+        logger.info(f"Cached {len(app.state.pages)} HTML pages")
+        
         # Initialize managers
         global session_manager, cookie_manager, oauth_manager, downloader, download_queue
         
@@ -135,7 +145,6 @@ async def lifespan(app: FastAPI):
         # Video downloader
         downloader = VideoDownloader(
             output_dir=settings.download_output_dir,
-            temp_dir=settings.download_temp_dir,
             max_retries=settings.max_retries,
             timeout=settings.download_timeout_seconds
         )
@@ -157,11 +166,19 @@ async def lifespan(app: FastAPI):
         #     auth.init_auth_routes(oauth_manager, session_manager, cookie_manager)
         #     logger.info("Initialized auth routes")
         
-        video.init_video_routes(download_queue, downloader, session_manager, cookie_manager)
+        video.init_video_routes(
+            download_queue, downloader, session_manager, cookie_manager,
+            max_concurrent=settings.max_concurrent_downloads_per_user
+        )
         logger.info("Initialized video routes")
         
+        # Start batched audit log writer
+        await audit_writer.start()
+        
         # Start background cleanup tasks
-        asyncio.create_task(periodic_cleanup())
+        await cleanup_scheduler.start()
+        app.state.shutdown = asyncio.Event()
+        cleanup_task = asyncio.create_task(periodic_cleanup(app.state.shutdown))
         
         logger.info("Application startup complete")
         
@@ -170,11 +187,19 @@ async def lifespan(app: FastAPI):
         # Shutdown
         logger.info("Shutting down application...")
         
+        # Let the cleanup loop finish its current pass and exit
+        app.state.shutdown.set()
+        await cleanup_task
+        await cleanup_scheduler.stop()
+        
         # Stop download workers
         if download_queue:
             await download_queue.stop_workers()
             logger.info("Stopped download workers")
         
+        # Write any queued audit entries
+        await audit_writer.stop()
+        
         logger.info("Application shutdown complete")
     
     except Exception as e:
@@ -182,9 +207,14 @@ async def lifespan(app: FastAPI):
         raise
 
 
+# Custom 404 page (read once at import)
+NOT_FOUND_PATH = Path(__file__).resolve().parent / "static" / "404.html"
+NOT_FOUND_PAGE = NOT_FOUND_PATH.read_bytes() if NOT_FOUND_PATH.exists() else b"Not Found"
+
+
 # Custom 404 handler
 async def not_found_handler(request, exc):
-    return FileResponse(Path(__file__).parent / "static" / "404.html", status_code=404)
+    return Response(NOT_FOUND_PAGE, status_code=404, media_type="text/html")
 
 # Create FastAPI app
 app = FastAPI(
@@ -192,6 +222,7 @@ app = FastAPI(
     version=settings.app_version,
     description="Download YouTube videos with authentication support",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     exception_handlers={404: not_found_handler}
 )
 
@@ -202,6 +233,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
+    max_age=86400,
 )
 
 # Include routers
@@ -220,90 +253,109 @@ static_dir = Path(__file__).parent / "static"
 if static_dir.exists():
     app.mount("/static", StaticFiles(directory=str(static_dir)), name="static")
 
+# HTML pages served from memory {name: path}
+STATIC_PAGES = {
+    "index": static_dir / "index.html",
+    "login": static_dir / "login.html",
+    "register": static_dir / "register.html",
+    "profile": static_dir / "profile.html",
+    "admin": static_dir / "admin" / "index.html",
+    "admin_users": static_dir / "admin" / "users.html",
+    "admin_settings": static_dir / "admin" / "settings.html",
+    "admin_downloads": static_dir / "admin" / "downloads.html",
+    "admin_logs": static_dir / "admin" / "logs.html",
+}
+
+
+def load_pages(pages: dict) -> dict:
+    """
+    Read HTML pages into memory.
+    
+    Args:
+        pages: Mapping of page name to file path
+        
+    Returns:
+        Mapping of page name to (content, etag) for pages that exist
+    """
+    cached = {}
+    for name, path in pages.items():
+        if path.exists():
+            content = path.read_bytes()
+            cached[name] = (content, f'"{hashlib.blake2b(content, digest_size=8).hexdigest()}"')
+    return cached
+
+
+def serve_page(request: Request, name: str, fallback: dict):
+    """Serve a cached HTML page, or the fallback body if it was not found at startup."""
+    page = request.app.state.pages.get(name)
+    if page is None:
+        return fallback
+    
+    # Revalidate on every load (cheap with the ETag) so a deploy never pairs
+    # old HTML with the new, uncached /static scripts
+    content, etag = page
+    headers = {"Cache-Control": "no-cache", "ETag": etag}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content, media_type="text/html", headers=headers)
+
 
 # Root endpoint - serve index.html
 @app.get("/")
-async def root():
+async def root(request: Request):
     """Serve the main application page."""
-    index_path = static_dir / "index.html"
-    if index_path.exists():
-        return FileResponse(index_path)
-    return {"message": "YouTube Video Downloader API", "version": settings.app_version}
+    return serve_page(request, "index", {"message": "YouTube Video Downloader API", "version": settings.app_version})
 
 
 # Login and register pages
 @app.get("/login")
-async def login_page():
+async def login_page(request: Request):
     """Serve the login page."""
-    login_path = static_dir / "login.html"
-    if login_path.exists():
-        return FileResponse(login_path)
-    return {"message": "Login page not found"}
+    return serve_page(request, "login", {"message": "Login page not found"})
 
 
 @app.get("/register")
-async def register_page():
+async def register_page(request: Request):
     """Serve the registration page."""
-    register_path = static_dir / "register.html"
-    if register_path.exists():
-        return FileResponse(register_path)
-    return {"message": "Registration page not found"}
+    return serve_page(request, "register", {"message": "Registration page not found"})
 
 
 @app.get("/profile")
-async def profile_page():
+async def profile_page(request: Request):
     """Serve the user profile page."""
-    profile_path = static_dir / "profile.html"
-    if profile_path.exists():
-        return FileResponse(profile_path)
-    return {"message": "Profile page not found"}
+    return serve_page(request, "profile", {"message": "Profile page not found"})
 
 
 # Admin dashboard
 @app.get("/admin")
-async def admin_dashboard():
+async def admin_dashboard(request: Request):
     """Serve the admin dashboard."""
-    admin_path = static_dir / "admin" / "index.html"
-    if admin_path.exists():
-        return FileResponse(admin_path)
-    return {"message": "Admin dashboard not found"}
+    return serve_page(request, "admin", {"message": "Admin dashboard not found"})
 
 
 # Admin subpages
 @app.get("/admin/users.html")
-async def admin_users():
+async def admin_users(request: Request):
     """Serve the admin users page."""
-    users_path = static_dir / "admin" / "users.html"
-    if users_path.exists():
-        return FileResponse(users_path)
-    return {"message": "Admin users page not found"}
+    return serve_page(request, "admin_users", {"message": "Admin users page not found"})
 
 
 @app.get("/admin/settings.html")
-async def admin_settings():
+async def admin_settings(request: Request):
     """Serve the admin settings page."""
-    settings_path = static_dir / "admin" / "settings.html"
-    if settings_path.exists():
-        return FileResponse(settings_path)
-    return {"message": "Admin settings page not found"}
+    return serve_page(request, "admin_settings", {"message": "Admin settings page not found"})
 
 
 @app.get("/admin/downloads.html")
-async def admin_downloads():
+async def admin_downloads(request: Request):
     """Serve the admin downloads page."""
-    downloads_path = static_dir / "admin" / "downloads.html"
-    if downloads_path.exists():
-        return FileResponse(downloads_path)
-    return {"message": "Admin downloads page not found"}
+    return serve_page(request, "admin_downloads", {"message": "Admin downloads page not found"})
 
 
 @app.get("/admin/logs.html")
-async def admin_logs():
+async def admin_logs(request: Request):
     """Serve the admin logs page."""
-    logs_path = static_dir / "admin" / "logs.html"
-    if logs_path.exists():
-        return FileResponse(logs_path)
-    return {"message": "Admin logs page not found"}
+    return serve_page(request, "admin_logs", {"message": "Admin logs page not found"})
 
 
 # Health check endpoint
@@ -328,12 +380,26 @@ async def youtube_downloader_exception_handler(request, exc: YouTubeDownloaderEr
     )
 
 
-async def periodic_cleanup():
-    """Background task for periodic cleanup."""
+async def periodic_cleanup(shutdown: asyncio.Event, interval: float = 3600):
+    """
+    Background task for periodic cleanup.
+    
+    Runs every ``interval`` seconds on a fixed schedule until ``shutdown`` is set.
+    """
+    loop = asyncio.get_running_loop()
+    next_run = loop.time() + interval
+    
     while True:
         try:
-            await asyncio.sleep(3600)  # Run every hour
-            
+            await asyncio.wait_for(shutdown.wait(), timeout=max(0, next_run - loop.time()))
+            break
+        except asyncio.TimeoutError:
+            pass
+        
+        # Schedule from the previous deadline so runs don't drift
+        next_run += interval
+        
+        try:
             # Cleanup expired sessions
             if session_manager:
                 session_manager.cleanup_expired()
@@ -346,6 +412,9 @@ async def periodic_cleanup():
             if download_queue:
                 download_queue.cleanup_old_downloads(max_age_hours=24)
             
+            # Cleanup playlist batches whose downloads have been dropped above
+            await loop.run_in_executor(None, playlist_tracker.cleanup_old, 24)
+            
             logger.info("Periodic cleanup completed")
         
         except Exception as e:
@@ -363,5 +432,7 @@ if __name__ == "__main__":
         host=settings.host,
         port=settings.port,
         reload=settings.debug,
+        loop="uvloop" if sys.platform != "win32" else "asyncio",
+        http="httptools",
         log_level=settings.log_level.lower()
     )
@@ -7,6 +7,7 @@ from models.youtube_credential import YouTubeCredential
 from models.settings import AppSetting, DEFAULT_SETTINGS
 from models.download_history import Download
 from models.audit_log import AuditLog
+from models.playlist_download import PlaylistDownload
 
 __all__ = [
     'User',
@@ -15,5 +16,6 @@ __all__ = [
     'AppSetting',
     'DEFAULT_SETTINGS',
     'Download',
-    'AuditLog'
+    'AuditLog',
+    'PlaylistDownload'
 ]
\ No newline at end of file
@@ -2,17 +2,23 @@
 Audit log model for tracking admin and user actions.
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index, JSON
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from database import Base
-import json
 
 
 class AuditLog(Base):
     """Audit log for tracking actions."""
     
     __tablename__ = "audit_logs"
+    __table_args__ = (
+        # Audit log list filtered by action or user, newest (highest id) first
+        Index('ix_audit_logs_action_recent', 'action', 'id'),
+        Index('ix_audit_logs_user_recent', 'user_id', 'id'),
+        Index('ix_audit_resource', 'resource_type', 'resource_id'),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey('users.id', ondelete='SET NULL'), nullable=True)
@@ -23,7 +29,7 @@ class AuditLog(Base):
     resource_id = Column(Integer, nullable=True)
     
     # Additional details
-    details = Column(Text, nullable=True)  # JSON string with additional info
+    details = Column(JSON().with_variant(JSONB(), 'postgresql'), nullable=True)  # Additional info (dict)
     ip_address = Column(String(45), nullable=True)  # IPv4 or IPv6
     user_agent = Column(String(500), nullable=True)
     
@@ -31,24 +37,13 @@ class AuditLog(Base):
     timestamp = Column(DateTime(timezone=True), server_default=func.now(), index=True)
     
     # Relationships
-    user = relationship("User", back_populates="audit_logs")
+    # Never lazy-loaded (avoids N+1 queries in listings): load it explicitly,
+    # e.g. options(selectinload(AuditLog.user)), before calling to_dict()
+    user = relationship("User", back_populates="audit_logs", lazy="raise")
     
     def __repr__(self):
         return f"<AuditLog(id={self.id}, action='{self.action}', user_id={self.user_id})>"
     
-    def get_details(self):
-        """Parse details JSON."""
-        if self.details:
-            try:
-                return json.loads(self.details)
-            except:
-                return {}
-        return {}
-    
-    def set_details(self, details_dict):
-        """Set details from dictionary."""
-        self.details = json.dumps(details_dict)
-    
     def to_dict(self):
         """Convert to dictionary for API responses."""
         return {
@@ -57,9 +52,9 @@ class AuditLog(Base):
             'action': self.action,
             'resource_type': self.resource_type,
             'resource_id': self.resource_id,
-            'details': self.get_details(),
+            'details': self.details or {},
             'ip_address': self.ip_address,
             'user_agent': self.user_agent,
             'timestamp': self.timestamp.isoformat() if self.timestamp else None,
-            'username': self.user.username if self.user else 'System'
+            'username': self.user.username if self.user_id is not None and self.user else 'System'
         }
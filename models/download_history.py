@@ -2,7 +2,7 @@
 Download history model for tracking user downloads.
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Enum as SQLEnum, BigInteger, Text
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Enum as SQLEnum, BigInteger, Text, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from database import Base
@@ -14,6 +14,12 @@ class Download(Base):
     """Download history and tracking."""
     
     __tablename__ = "downloads"
+    __table_args__ = (
+        # Per-user history and active-download counts
+        Index('ix_downloads_user_status', 'user_id', 'status', 'created_at'),
+        # Per-user history listing, newest (highest id) first
+        Index('ix_downloads_user_recent', 'user_id', 'id'),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     download_id = Column(String(100), unique=True, index=True, nullable=False)  # UUID
@@ -72,3 +78,12 @@ class Download(Base):
             'started_at': self.started_at.isoformat() if self.started_at else None,
             'completed_at': self.completed_at.isoformat() if self.completed_at else None
         }
+
+
+# Columns returned by download listings (matches Download.to_dict())
+DOWNLOAD_LIST_COLUMNS = (
+    Download.id, Download.download_id, Download.user_id, Download.youtube_url, Download.video_id,
+    Download.video_title, Download.video_duration, Download.format_type, Download.quality,
+    Download.file_size, Download.file_name, Download.status, Download.progress, Download.error_message,
+    Download.created_at, Download.started_at, Download.completed_at
+)
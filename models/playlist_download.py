@@ -0,0 +1,33 @@
+"""
+Playlist download model for tracking the videos queued from one playlist.
+"""
+
+from sqlalchemy import Column, Integer, String, DateTime, JSON
+from sqlalchemy.sql import func
+from database import Base
+
+
+class PlaylistDownload(Base):
+    """Playlist download batch: which queued downloads belong to one playlist request."""
+    
+    __tablename__ = "playlist_downloads"
+    
+    playlist_id = Column(String(36), primary_key=True)  # ID handed out by /playlist/download (routes.video._make_id)
+    title = Column(String(500), nullable=True)
+    total = Column(Integer, nullable=False)
+    download_ids = Column(JSON, nullable=False)  # Queue download IDs, in playlist order
+    
+    # Timestamps
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+    
+    def __repr__(self):
+        return f"<PlaylistDownload(playlist_id='{self.playlist_id}', total={self.total})>"
+    
+    def to_dict(self):
+        """Convert to dictionary for API responses."""
+        return {
+            'playlist_id': self.playlist_id,
+            'title': self.title,
+            'total': self.total,
+            'download_ids': self.download_ids or []
+        }
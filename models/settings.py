@@ -2,11 +2,62 @@
 Application settings model for dynamic configuration.
 """
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
+import time
+from functools import cached_property, lru_cache
+from typing import Any, Dict, Optional
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, bindparam, event, select, update
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from database import Base
-import json
+from utils.json import dumps, loads
+
+
+# Canonical boolean strings (other spellings fall back to a case-insensitive check)
+_BOOL_MAP = {'true': True, 'false': False, '1': True, '0': False, 'yes': True, 'no': False}
+
+
+@lru_cache(maxsize=128)
+def _parse_scalar(value_type: str, value: str):
+    """
+    Convert a raw integer/boolean setting string; memoized since these are
+    immutable and small.
+    
+    Args:
+        value_type: Setting type (integer or boolean)
+        value: Raw value as stored in the database
+        
+    Returns:
+        Parsed value
+    """
+    if value_type == "integer":
+        return int(value)
+    parsed = _BOOL_MAP.get(value)
+    if parsed is None:
+        parsed = value.lower() in ('true', '1', 'yes')
+    return parsed
+
+
+def parse_setting_value(value_type: str, value: str):
+    """
+    Convert a raw setting string to its typed value.
+    
+    Only integer and boolean results are memoized: json values are parsed
+    into a fresh object per call so callers cannot mutate each other's copy,
+    and string/text values (which include cookie blobs) are not retained.
+    
+    Args:
+        value_type: Setting type (string, integer, boolean, json, text)
+        value: Raw value as stored in the database
+        
+    Returns:
+        Parsed value
+    """
+    if value_type in ("integer", "boolean"):
+        return _parse_scalar(value_type, value)
+    elif value_type == "json":
+        return loads(value)
+    else:
+        return value
 
 
 class AppSetting(Base):
@@ -32,21 +83,19 @@ class AppSetting(Base):
     def __repr__(self):
         return f"<AppSetting(key='{self.key}', category='{self.category}')>"
     
+    @cached_property
+    def parsed_value(self):
+        """Parsed value, computed once per instance and reset whenever value/value_type is set."""
+        return parse_setting_value(self.value_type, self.value)
+    
     def get_value(self):
         """Get the parsed value based on type."""
-        if self.value_type == "integer":
-            return int(self.value)
-        elif self.value_type == "boolean":
-            return self.value.lower() in ('true', '1', 'yes')
-        elif self.value_type == "json":
-            return json.loads(self.value)
-        else:
-            return self.value
+        return self.parsed_value
     
     def set_value(self, value):
         """Set value with automatic type conversion."""
         if self.value_type == "json":
-            self.value = json.dumps(value)
+            self.value = dumps(value)
         else:
             self.value = str(value)
     
@@ -64,6 +113,13 @@ class AppSetting(Base):
         }
 
 
+@event.listens_for(AppSetting.value, 'set')
+@event.listens_for(AppSetting.value_type, 'set')
+def _reset_parsed_value(target, value, oldvalue, initiator):
+    """Drop the cached parsed_value when the raw value or its type is assigned."""
+    target.__dict__.pop('parsed_value', None)
+
+
 # Default settings to be inserted on first run
 DEFAULT_SETTINGS = [
     {
@@ -145,30 +201,160 @@ DEFAULT_SETTINGS = [
     }
 ]
 
+# Prebuilt statements for the settings cache: built once at import, and their
+# compiled SQL is reused from the engine's compiled cache on every execution
+_SETTING_VALUE_STMT = select(AppSetting.value_type, AppSetting.value).where(AppSetting.key == bindparam('key'))
+_ALL_SETTINGS_STMT = select(AppSetting.key, AppSetting.value_type, AppSetting.value)
+
+
+def get_setting_value(db_session, key: str, default=None):
+    """
+    Get the parsed value of a setting by key.
+    
+    Args:
+        db_session: Database session
+        key: Setting key
+        default: Value returned when the setting does not exist
+        
+    Returns:
+        Parsed setting value or default
+    """
+    row = db_session.execute(_SETTING_VALUE_STMT, {'key': key}).first()
+    if row is None:
+        return default
+    return parse_setting_value(row.value_type, row.value)
+
+
+# Marks "not cached / not found" where None is a valid setting value
+_MISSING = object()
+
+
+class SettingsCache:
+    """
+    In-process snapshot of parsed setting values.
+    
+    Values are loaded at startup and on first use; writers call invalidate()
+    after committing so the next read goes back to the database. The snapshot
+    also expires after ``ttl`` seconds so changes made outside this process
+    (other workers, scripts/update_settings.py) are picked up.
+    """
+    
+    def __init__(self, ttl: float = 300):
+        """
+        Initialize an empty cache.
+        
+        Args:
+            ttl: Seconds before the snapshot is dropped and re-read
+        """
+        self.ttl = ttl
+        
+        # Parsed values {key: value}
+        self._values: Dict[str, Any] = {}
+        self._expires_at = time.monotonic() + ttl
+    
+    def _expire_if_stale(self) -> None:
+        """Drop the snapshot once its TTL has passed."""
+        now = time.monotonic()
+        if now >= self._expires_at:
+            self._values.clear()
+            self._expires_at = now + self.ttl
+    
+    def load(self, db_session) -> None:
+        """
+        Load all settings into the cache.
+        
+        Args:
+            db_session: Database session
+        """
+        rows = db_session.execute(_ALL_SETTINGS_STMT).all()
+        self._values = {row.key: parse_setting_value(row.value_type, row.value) for row in rows}
+        self._expires_at = time.monotonic() + self.ttl
+    
+    def get(self, db_session, key: str, default=None):
+        """
+        Get a parsed setting value, reading it from the database on a miss.
+        
+        Args:
+            db_session: Database session used on a cache miss
+            key: Setting key
+            default: Value returned when the setting does not exist
+            
+        Returns:
+            Parsed setting value or default
+        """
+        self._expire_if_stale()
+        if key in self._values:
+            return self._values[key]
+        
+        value = get_setting_value(db_session, key, _MISSING)
+        if value is _MISSING:
+            return default
+        
+        self._values[key] = value
+        return value
+    
+    def peek(self, key: str, default=None):
+        """
+        Get a cached value without touching the database.
+        
+        Lets async callers answer from memory and only hand the query to a
+        worker thread on a miss.
+        
+        Args:
+            key: Setting key
+            default: Value returned when the key is not cached
+            
+        Returns:
+            Cached parsed value or default
+        """
+        self._expire_if_stale()
+        return self._values.get(key, default)
+    
+    def get_int(self, db_session, key: str, default: int = 0) -> int:
+        """Get a setting value as an integer."""
+        return int(self.get(db_session, key, default))
+    
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """
+        Drop a cached value (or all values).
+        
+        Args:
+            key: Setting key, or None to clear the whole cache
+        """
+        if key is None:
+            self._values.clear()
+        else:
+            self._values.pop(key, None)
+
+
+# Global settings cache instance
+settings_cache = SettingsCache()
+
+
 def ensure_default_settings(db_session):
     """Ensure all default settings exist in the database."""
     try:
-        count = 0
-        for default in DEFAULT_SETTINGS:
-            existing = db_session.query(AppSetting).filter(AppSetting.key == default['key']).first()
-            if not existing:
-                setting = AppSetting(
-                    key=default['key'],
-                    value=default['value'],
-                    category=default['category'],
-                    description=default['description'],
-                    value_type=default['value_type']
-                )
-                db_session.add(setting)
-                count += 1
-            else:
-                 # Check if type needs update for existing keys (specifically youtube_cookies)
-                 if existing.key == 'youtube_cookies' and existing.value_type != 'text':
-                      existing.value_type = 'text'
-                      count += 1
-
+        if db_session.get_bind().dialect.name == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert
+        
+        # Insert any missing keys in one statement
+        result = db_session.execute(
+            insert(AppSetting).values(DEFAULT_SETTINGS).on_conflict_do_nothing(index_elements=['key'])
+        )
+        count = result.rowcount
+        
+        # youtube_cookies used to be stored with a non-text type
+        result = db_session.execute(
+            update(AppSetting)
+            .where(AppSetting.key == 'youtube_cookies', AppSetting.value_type != 'text')
+            .values(value_type='text')
+        )
+        count += result.rowcount
+        
+        db_session.commit()
         if count > 0:
-            db_session.commit()
             print(f"Added/Updated {count} default settings.")
     except Exception as e:
         print(f"Error ensuring default settings: {e}")
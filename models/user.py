@@ -2,7 +2,7 @@
 User model for authentication and authorization.
 """
 
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Enum as SQLEnum
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Enum as SQLEnum, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from database import Base
@@ -20,6 +20,10 @@ class User(Base):
     """User model for authentication."""
     
     __tablename__ = "users"
+    __table_args__ = (
+        # Admin user list: filter by role/status, newest first
+        Index('ix_users_role_active_created', 'role', 'is_active', 'created_at'),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     username = Column(String(50), unique=True, index=True, nullable=False)
@@ -73,3 +77,7 @@ class User(Base):
             ]
         
         return data
+
+
+# Case-insensitive email lookups (func.lower(User.email) == ...)
+Index('ix_users_email_lower', func.lower(User.email))
@@ -2,21 +2,54 @@
 Admin API routes for system administration.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+import asyncio
+import hashlib
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
+from fastapi.responses import ORJSONResponse, Response
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import delete, func, insert, or_, select, true
 from pydantic import BaseModel, EmailStr, Field
-from typing import List, Optional
+from typing import Optional
 from datetime import datetime, timedelta
 from database import get_db
 from models import User, UserRole, YouTubeCredential, AppSetting, Download, AuditLog
+from models.settings import parse_setting_value, settings_cache
+from models.download_history import DOWNLOAD_LIST_COLUMNS
 from auth.dependencies import get_current_admin_user
 from auth.auth_utils import get_password_hash
 from utils.logging_config import get_logger
+from utils.pagination import cursor_headers, keyset_page
+from utils.cache import TTLCache
+from routes import video
 
 logger = get_logger(__name__)
 
-router = APIRouter(prefix="/admin", tags=["admin"])
+router = APIRouter(prefix="/admin", tags=["admin"], default_response_class=ORJSONResponse)
+
+# Dashboard stats are polled; recompute at most every 30 seconds unless invalidated
+system_stats_cache = TTLCache(ttl=30, maxsize=1)
+
+
+def invalidate_system_stats():
+    """Drop the cached system stats after a change that affects them."""
+    system_stats_cache.invalidate("system_stats")
+
+
+def record_audit_log(db: Session, **values):
+    """
+    Write an audit log row inside the caller's transaction.
+    
+    Issues a Core INSERT straight away instead of staging an ORM object, so
+    the entry is committed by the handler's single commit together with the
+    change it describes.
+    
+    Args:
+        db: Database session
+        **values: AuditLog column values
+    """
+    db.execute(insert(AuditLog).values(**values))
+
+
 @router.post("/__bootstrap_admin", include_in_schema=False)
 def bootstrap_admin(
     email: EmailStr = Query(..., description="Email of the user to promote"),
@@ -32,6 +65,7 @@ def bootstrap_admin(
 
     user.role = UserRole.ADMIN  # أو user.is_admin = True حسب الموديل
     db.commit()
+    invalidate_system_stats()
 
     logger.warning(f"BOOTSTRAP: Promoted {user.email} to ADMIN")
 
@@ -78,11 +112,28 @@ class SystemStatsResponse(BaseModel):
     total_storage_used: int
 
 
+# Columns selected by the list endpoints (same keys as the models' to_dict)
+USER_LIST_COLUMNS = (
+    User.id, User.username, User.email, User.role, User.is_active, User.is_email_verified,
+    User.storage_used, User.storage_quota, User.download_limit_daily, User.concurrent_downloads,
+    User.created_at, User.last_login
+)
+SETTING_LIST_COLUMNS = (
+    AppSetting.id, AppSetting.key, AppSetting.value, AppSetting.category, AppSetting.description,
+    AppSetting.value_type, AppSetting.updated_at, AppSetting.updated_by
+)
+AUDIT_LOG_LIST_COLUMNS = (
+    AuditLog.id, AuditLog.user_id, AuditLog.action, AuditLog.resource_type, AuditLog.resource_id,
+    AuditLog.details, AuditLog.ip_address, AuditLog.user_agent, AuditLog.timestamp,
+    func.coalesce(User.username, 'System').label('username')
+)
+
+
 # ============================================
 # User Management
 # ============================================
 
-@router.get("/users", response_model=List[dict])
+@router.get("/users")
 async def list_users(
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
@@ -105,16 +156,17 @@ async def list_users(
     Returns:
         List of users
     """
-    query = db.query(User)
+    # Select plain rows instead of hydrating ORM instances
+    query = select(*USER_LIST_COLUMNS)
     
     if role:
-        query = query.filter(User.role == role)
+        query = query.where(User.role == role)
     if is_active is not None:
-        query = query.filter(User.is_active == is_active)
+        query = query.where(User.is_active == is_active)
     
-    users = query.order_by(User.created_at.desc()).offset(skip).limit(limit).all()
+    rows = db.execute(query.order_by(User.created_at.desc()).offset(skip).limit(limit)).mappings()
     
-    return [user.to_dict() for user in users]
+    return ORJSONResponse([dict(row) for row in rows])
 
 
 @router.post("/users", response_model=dict, status_code=status.HTTP_201_CREATED)
@@ -134,15 +186,18 @@ async def create_user(
     Returns:
         Created user
     """
-    # Check if username exists
-    if db.query(User).filter(User.username == request_data.username).first():
+    # Check if username or email exists (one query; at most one row can match each)
+    existing = db.query(User.username, User.email).filter(
+        or_(User.username == request_data.username, User.email == request_data.email)
+    ).limit(2).all()
+    
+    if any(row.username == request_data.username for row in existing):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Username already exists"
         )
     
-    # Check if email exists
-    if db.query(User).filter(User.email == request_data.email).first():
+    if existing:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already exists"
@@ -151,14 +206,18 @@ async def create_user(
     # Get default quota if not specified
     storage_quota = request_data.storage_quota
     if storage_quota is None:
-        quota_setting = db.query(AppSetting).filter(AppSetting.key == "default_storage_quota_gb").first()
-        storage_quota = int(quota_setting.get_value()) * 1073741824 if quota_setting else 10737418240
+        storage_quota = settings_cache.get_int(db, "default_storage_quota_gb", 10) * 1073741824
+    
+    # bcrypt is CPU-bound (and releases the GIL); keep it off the event loop
+    password_hash = await asyncio.get_running_loop().run_in_executor(
+        None, get_password_hash, request_data.password
+    )
     
     # Create user
     user = User(
         username=request_data.username,
         email=request_data.email,
-        password_hash=get_password_hash(request_data.password),
+        password_hash=password_hash,
         role=request_data.role,
         is_active=True,
         is_email_verified=True,  # Admin-created users are auto-verified
@@ -168,23 +227,27 @@ async def create_user(
     )
     
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    db.flush()  # Assign user.id for the audit log
     
-    # Audit log
-    log = AuditLog(
+    # Audit log (committed together with the user)
+    record_audit_log(
+        db,
         user_id=current_admin.id,
         action="user_created_by_admin",
         resource_type="user",
-        resource_id=user.id
+        resource_id=user.id,
+        details={"username": user.username, "role": user.role.value}
     )
-    log.set_details({"username": user.username, "role": user.role.value})
-    db.add(log)
+    
+    # The flush already fetched created_at (INSERT ... RETURNING); serialize
+    # before commit expires the instance so no follow-up SELECT is needed.
+    user_data = user.to_dict()
     db.commit()
+    invalidate_system_stats()
     
-    logger.info(f"Admin {current_admin.username} created user: {user.username}")
+    logger.info(f"Admin {current_admin.username} created user: {user_data['username']}")
     
-    return user.to_dict()
+    return user_data
 
 
 @router.get("/users/{user_id}", response_model=dict)
@@ -194,7 +257,9 @@ async def get_user(
     db: Session = Depends(get_db)
 ):
     """Get specific user details."""
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.query(User).options(
+        selectinload(User.youtube_credentials).defer(YouTubeCredential.encrypted_cookies)
+    ).filter(User.id == user_id).first()
     
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
@@ -229,7 +294,7 @@ async def update_user(
     # Update fields
     if request_data.email is not None:
         # Check email uniqueness
-        existing = db.query(User).filter(User.email == request_data.email, User.id != user_id).first()
+        existing = db.query(User.id).filter(User.email == request_data.email, User.id != user_id).first()
         if existing:
             raise HTTPException(status_code=400, detail="Email already in use")
         user.email = request_data.email
@@ -245,23 +310,25 @@ async def update_user(
     if request_data.concurrent_downloads is not None:
         user.concurrent_downloads = request_data.concurrent_downloads
     
-    db.commit()
-    db.refresh(user)
-    
-    # Audit log
-    log = AuditLog(
+    # Audit log (committed together with the update)
+    record_audit_log(
+        db,
         user_id=current_admin.id,
         action="user_updated_by_admin",
         resource_type="user",
-        resource_id=user.id
+        resource_id=user.id,
+        details=request_data.model_dump(mode="json", exclude_none=True)
     )
-    log.set_details(request_data.dict(exclude_none=True))
-    db.add(log)
+    
+    # Every field in to_dict() is already known; serialize before commit
+    # expires the instance instead of refreshing it afterwards.
+    user_data = user.to_dict()
     db.commit()
+    invalidate_system_stats()
     
-    logger.info(f"Admin {current_admin.username} updated user: {user.username}")
+    logger.info(f"Admin {current_admin.username} updated user: {user_data['username']}")
     
-    return user.to_dict()
+    return user_data
 
 
 @router.delete("/users/{user_id}")
@@ -282,17 +349,18 @@ async def delete_user(
     username = user.username
     
     # Audit log before deletion
-    log = AuditLog(
+    record_audit_log(
+        db,
         user_id=current_admin.id,
         action="user_deleted_by_admin",
         resource_type="user",
-        resource_id=user.id
+        resource_id=user.id,
+        details={"username": username}
     )
-    log.set_details({"username": username})
-    db.add(log)
     
     db.delete(user)
     db.commit()
+    invalidate_system_stats()
     
     logger.info(f"Admin {current_admin.username} deleted user: {username}")
     
@@ -326,18 +394,19 @@ async def reset_user_password(
         raise HTTPException(status_code=404, detail="User not found")
     
     # Update password
-    user.password_hash = get_password_hash(request.new_password)
-    db.commit()
+    user.password_hash = await asyncio.get_running_loop().run_in_executor(
+        None, get_password_hash, request.new_password
+    )
     
-    # Audit log
-    log = AuditLog(
+    # Audit log (committed together with the password change)
+    record_audit_log(
+        db,
         user_id=current_admin.id,
         action="password_reset_by_admin",
         resource_type="user",
-        resource_id=user.id
+        resource_id=user.id,
+        details={"username": user.username}
     )
-    log.set_details({"username": user.username})
-    db.add(log)
     db.commit()
     
     logger.info(f"Admin {current_admin.username} reset password for user: {user.username}")
@@ -349,21 +418,34 @@ async def reset_user_password(
 # Settings Management
 # ============================================
 
-@router.get("/settings", response_model=List[dict])
+@router.get("/settings")
 async def get_all_settings(
+    request: Request,
     category: Optional[str] = None,
     current_admin: User = Depends(get_current_admin_user),
     db: Session = Depends(get_db)
 ):
     """Get all application settings."""
-    query = db.query(AppSetting)
+    # Select plain rows instead of hydrating ORM instances
+    query = select(*SETTING_LIST_COLUMNS)
     
     if category:
-        query = query.filter(AppSetting.category == category)
+        query = query.where(AppSetting.category == category)
+    
+    rows = db.execute(query.order_by(AppSetting.category, AppSetting.key)).all()
     
-    settings = query.order_by(AppSetting.category, AppSetting.key).all()
+    # The table is small, so the ETag hashes the rows themselves: any change
+    # to a returned value, description or timestamp changes it
+    etag = '"' + hashlib.blake2b(repr([tuple(row) for row in rows]).encode(), digest_size=8).hexdigest() + '"'
+    headers = {"Cache-Control": "private, no-cache", "ETag": etag}
     
-    return [setting.to_dict() for setting in settings]
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    
+    return ORJSONResponse([
+        {**row._mapping, 'value': parse_setting_value(row.value_type, row.value)}
+        for row in rows
+    ], headers=headers)
 
 
 @router.put("/settings/{setting_key}", response_model=dict)
@@ -384,23 +466,24 @@ async def update_setting(
     setting.updated_by = current_admin.id
     setting.updated_at = datetime.utcnow()
     
-    db.commit()
-    db.refresh(setting)
-    
-    # Audit log
-    log = AuditLog(
+    # Audit log (committed together with the setting)
+    record_audit_log(
+        db,
         user_id=current_admin.id,
         action="setting_updated",
         resource_type="app_setting",
-        resource_id=setting.id
+        resource_id=setting.id,
+        details={"key": setting_key, "old_value": str(old_value), "new_value": request_data.value}
     )
-    log.set_details({"key": setting_key, "old_value": str(old_value), "new_value": request_data.value})
-    db.add(log)
+    
+    # Every column in to_dict() was just set; serialize before commit expires the instance
+    setting_data = setting.to_dict()
     db.commit()
+    settings_cache.invalidate(setting_key)
     
     logger.info(f"Admin {current_admin.username} updated setting {setting_key}: {old_value} -> {request_data.value}")
     
-    return setting.to_dict()
+    return setting_data
 
 
 # ============================================
@@ -415,24 +498,49 @@ async def get_system_stats(
     """Get system-wide statistics."""
     from download.models import DownloadStatus
     
-    # User stats
-    total_users = db.query(User).count()
-    active_users = db.query(User).filter(User.is_active == True).count()
-    admin_users = db.query(User).filter(User.role == UserRole.ADMIN).count()
-    
-    # Download stats
-    total_downloads = db.query(Download).count()
-    active_downloads = db.query(Download).filter(
-        Download.status.in_([DownloadStatus.PENDING, DownloadStatus.DOWNLOADING])
-    ).count()
-    
-    # Credential stats
-    total_credentials = db.query(YouTubeCredential).count()
-    
-    # Storage stats
-    total_storage_used = db.query(func.sum(User.storage_used)).scalar() or 0
-    
-    return {
+    cached = system_stats_cache.get("system_stats")
+    if cached is not None:
+        return cached
+    
+    # Per-table conditional aggregates, fused into a single round-trip
+    user_stats = select(
+        func.count().label('total'),
+        func.count().filter(User.is_active == True).label('active'),
+        func.count().filter(User.role == UserRole.ADMIN).label('admin'),
+        # Rides the same users scan as the counts above, so a separate
+        # running-total row would not save a scan
+        func.coalesce(func.sum(User.storage_used), 0).label('storage')
+    ).select_from(User).subquery()
+    
+    download_stats = select(
+        func.count().label('total'),
+        func.count().filter(
+            Download.status.in_([DownloadStatus.PENDING, DownloadStatus.DOWNLOADING])
+        ).label('active')
+    ).select_from(Download).subquery()
+    
+    credential_count = select(func.count()).select_from(YouTubeCredential).scalar_subquery()
+    
+    stats = db.execute(
+        select(
+            user_stats.c.total.label('total_users'),
+            user_stats.c.active.label('active_users'),
+            user_stats.c.admin.label('admin_users'),
+            user_stats.c.storage.label('total_storage_used'),
+            download_stats.c.total.label('total_downloads'),
+            download_stats.c.active.label('active_downloads'),
+            credential_count.label('total_credentials')
+        ).select_from(user_stats.join(download_stats, true()))
+    ).one()
+    total_users = stats.total_users
+    active_users = stats.active_users
+    admin_users = stats.admin_users
+    total_downloads = stats.total_downloads
+    active_downloads = stats.active_downloads
+    total_credentials = stats.total_credentials
+    total_storage_used = stats.total_storage_used
+    
+    stats = {
         "total_users": total_users,
         "active_users": active_users,
         "admin_users": admin_users,
@@ -441,47 +549,60 @@ async def get_system_stats(
         "total_credentials": total_credentials,
         "total_storage_used": total_storage_used
     }
+    system_stats_cache.set("system_stats", stats)
+    
+    return stats
 
 
-@router.get("/downloads", response_model=List[dict])
+@router.get("/downloads")
 async def get_all_downloads(
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
+    cursor: Optional[int] = Query(None, ge=1),
     user_id: Optional[int] = None,
     current_admin: User = Depends(get_current_admin_user),
     db: Session = Depends(get_db)
 ):
     """Get all downloads across all users."""
-    query = db.query(Download)
+    # Select plain rows instead of hydrating ORM instances
+    query = db.query(*DOWNLOAD_LIST_COLUMNS)
     
     if user_id:
         query = query.filter(Download.user_id == user_id)
     
-    downloads = query.order_by(Download.created_at.desc()).offset(skip).limit(limit).all()
+    downloads, next_cursor = keyset_page(query, Download.id, limit, cursor, skip)
     
-    return [download.to_dict() for download in downloads]
+    return ORJSONResponse(
+        [row._asdict() for row in downloads],
+        headers=cursor_headers(next_cursor)
+    )
 
 
-@router.get("/logs", response_model=List[dict])
+@router.get("/logs")
 async def get_audit_logs(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[int] = Query(None, ge=1),
     action: Optional[str] = None,
     user_id: Optional[int] = None,
     current_admin: User = Depends(get_current_admin_user),
     db: Session = Depends(get_db)
 ):
     """Get audit logs."""
-    query = db.query(AuditLog)
+    # Plain rows with the actor's username joined in, instead of ORM instances
+    query = db.query(*AUDIT_LOG_LIST_COLUMNS).outerjoin(User, AuditLog.user_id == User.id)
     
     if action:
         query = query.filter(AuditLog.action == action)
     if user_id:
         query = query.filter(AuditLog.user_id == user_id)
     
-    logs = query.order_by(AuditLog.timestamp.desc()).offset(skip).limit(limit).all()
+    logs, next_cursor = keyset_page(query, AuditLog.id, limit, cursor, skip)
     
-    return [log.to_dict() for log in logs]
+    return ORJSONResponse(
+        [{**row._asdict(), 'details': row.details or {}} for row in logs],
+        headers=cursor_headers(next_cursor)
+    )
 
 
 @router.delete("/logs")
@@ -491,18 +612,17 @@ async def delete_all_logs(
 ):
     """Delete all audit logs."""
     try:
-        # Delete all logs
-        db.query(AuditLog).delete()
-        db.commit()
+        # Delete all logs in one statement, without ORM session synchronisation
+        db.execute(delete(AuditLog.__table__))
         
-        # Log this action (will be the first new log)
-        log = AuditLog(
+        # Log this action (will be the first new log, same transaction as the delete)
+        record_audit_log(
+            db,
             user_id=current_admin.id,
             action="logs_cleared",
             resource_type="system",
             resource_id=0
         )
-        db.add(log)
         db.commit()
         
         logger.info(f"Admin {current_admin.username} cleared all audit logs")
@@ -514,3 +634,19 @@ async def delete_all_logs(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to clear logs"
         )
+
+
+# ============================================
+# Cache Management
+# ============================================
+
+@router.delete("/cache/metadata")
+async def clear_metadata_cache(
+    current_admin: User = Depends(get_current_admin_user)
+):
+    """Drop cached video/playlist metadata so the next request re-extracts it."""
+    video.clear_metadata_cache()
+    
+    logger.info(f"Admin {current_admin.username} cleared the metadata cache")
+    
+    return {"message": "Metadata cache cleared"}
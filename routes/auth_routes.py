@@ -2,12 +2,18 @@
 Authentication API routes for user registration, login, and logout.
 """
 
+import asyncio
+import secrets
 from datetime import datetime
+from functools import cache
+from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Request
 from sqlalchemy.orm import Session
+from sqlalchemy import or_
 from pydantic import BaseModel, EmailStr, Field
 from database import get_db
 from models import User, UserRole, AuditLog
+from models.settings import settings_cache
 from auth.auth_utils import (
     verify_password,
     get_password_hash,
@@ -17,12 +23,40 @@ from auth.auth_utils import (
 )
 from auth.dependencies import get_current_user, get_current_active_user
 from utils.logging_config import get_logger
+from utils.audit_writer import audit_writer
+from routes.admin_routes import invalidate_system_stats
 
 logger = get_logger(__name__)
 
 router = APIRouter(prefix="/api/auth", tags=["authentication"])
 
 
+@cache
+def _dummy_password_hash() -> str:
+    """
+    Hash verified against when the username does not exist, so unknown and
+    known usernames cost the same bcrypt work (no timing oracle for
+    enumeration). Computed on first use rather than at import.
+    """
+    return get_password_hash(secrets.token_urlsafe(16))
+
+
+def _check_login_password(password: str, password_hash: Optional[str]) -> bool:
+    """
+    Verify a login password, falling back to the dummy hash for unknown users.
+    
+    Args:
+        password: Submitted password
+        password_hash: Stored hash, or None when the user does not exist
+        
+    Returns:
+        True if the password matches
+    """
+    if password_hash is None:
+        password_hash = _dummy_password_hash()
+    return verify_password(password, password_hash)
+
+
 # Request/Response Models
 class RegisterRequest(BaseModel):
     """User registration request."""
@@ -57,17 +91,28 @@ class UserResponse(BaseModel):
 
 
 def create_audit_log(db: Session, user_id: int, action: str, details: dict, request: Request = None):
-    """Helper to create audit log entry."""
+    """Helper to add an audit log entry; committed by the caller together with its change."""
     log = AuditLog(
         user_id=user_id,
         action=action,
         resource_type="auth",
         ip_address=request.client.host if request else None,
-        user_agent=request.headers.get("user-agent") if request else None
+        user_agent=request.headers.get("user-agent") if request else None,
+        details=details
     )
-    log.set_details(details)
     db.add(log)
-    db.commit()
+
+
+def queue_audit_log(user_id: int, action: str, details: dict, request: Request = None):
+    """Helper to queue an audit log entry that has no primary write (batched in the background)."""
+    audit_writer.enqueue(
+        user_id=user_id,
+        action=action,
+        resource_type="auth",
+        ip_address=request.client.host if request else None,
+        user_agent=request.headers.get("user-agent") if request else None,
+        details=details
+    )
 
 
 @router.post("/register", response_model=TokenResponse, status_code=status.HTTP_201_CREATED)
@@ -90,10 +135,8 @@ async def register(
     Raises:
         HTTPException: If username/email already exists or validation fails
     """
-    # Check if registration is enabled (from settings)
-    from models import AppSetting
-    reg_setting = db.query(AppSetting).filter(AppSetting.key == "registration_enabled").first()
-    if reg_setting and not reg_setting.get_value():
+    # Check if registration is enabled (from the in-process settings cache)
+    if not settings_cache.get(db, "registration_enabled", True):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Registration is currently disabled"
@@ -107,58 +150,66 @@ async def register(
             detail=error_msg
         )
     
-    # Check if username already exists
-    existing_user = db.query(User).filter(User.username == request_data.username).first()
-    if existing_user:
+    # Check if username or email exists (one query; at most one row can match each)
+    existing = db.query(User.username, User.email).filter(
+        or_(User.username == request_data.username, User.email == request_data.email)
+    ).limit(2).all()
+    
+    if any(row.username == request_data.username for row in existing):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Username already registered"
         )
     
-    # Check if email already exists
-    existing_email = db.query(User).filter(User.email == request_data.email).first()
-    if existing_email:
+    if existing:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered"
         )
     
     # Get default storage quota from settings
-    quota_setting = db.query(AppSetting).filter(AppSetting.key == "default_storage_quota_gb").first()
-    default_quota = int(quota_setting.get_value()) * 1073741824 if quota_setting else 10737418240  # 10GB
+    default_quota = settings_cache.get_int(db, "default_storage_quota_gb", 10) * 1073741824  # 10GB default
+    
+    # bcrypt is CPU-bound (and releases the GIL); keep it off the event loop
+    password_hash = await asyncio.get_running_loop().run_in_executor(
+        None, get_password_hash, request_data.password
+    )
     
     # Create new user
     user = User(
         username=request_data.username,
         email=request_data.email,
-        password_hash=get_password_hash(request_data.password),
+        password_hash=password_hash,
         role=UserRole.USER,
         is_active=True,
         storage_quota=default_quota
     )
     
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    db.flush()  # Assign user.id (and created_at) for the audit log and response
     
-    # Create audit log
+    # Create audit log (committed together with the user)
     create_audit_log(
         db, user.id, "user_registered",
         {"username": user.username, "email": user.email},
         request
     )
     
+    user_data = user.to_dict()
+    db.commit()
+    invalidate_system_stats()
+    
     # Generate tokens
-    access_token = create_access_token(data={"sub": user.username})
-    refresh_token = create_refresh_token(data={"sub": user.username})
+    access_token = create_access_token(data={"sub": user_data["username"]})
+    refresh_token = create_refresh_token(data={"sub": user_data["username"]})
     
-    logger.info(f"New user registered: {user.username}")
+    logger.info(f"New user registered: {user_data['username']}")
     
     return {
         "access_token": access_token,
         "refresh_token": refresh_token,
         "token_type": "bearer",
-        "user": user.to_dict()
+        "user": user_data
     }
 
 
@@ -185,12 +236,16 @@ async def login(
     # Find user
     user = db.query(User).filter(User.username == request_data.username).first()
     
-    # Verify password
-    if not user or not verify_password(request_data.password, user.password_hash):
+    # Verify password (bcrypt runs in the default executor, even for unknown users)
+    password_ok = await asyncio.get_running_loop().run_in_executor(
+        None, _check_login_password, request_data.password,
+        user.password_hash if user else None
+    )
+    if not user or not password_ok:
         # Create failed login audit log
         if user:
-            create_audit_log(
-                db, user.id, "login_failed",
+            queue_audit_log(
+                user.id, "login_failed",
                 {"username": request_data.username, "reason": "invalid_password"},
                 request
             )
@@ -203,8 +258,8 @@ async def login(
     
     # Check if user is active
     if not user.is_active:
-        create_audit_log(
-            db, user.id, "login_failed",
+        queue_audit_log(
+            user.id, "login_failed",
             {"username": request_data.username, "reason": "account_suspended"},
             request
         )
@@ -216,26 +271,28 @@ async def login(
     
     # Update last login
     user.last_login = datetime.utcnow()
-    db.commit()
     
-    # Create audit log
+    # Create audit log (committed together with last_login)
     create_audit_log(
         db, user.id, "login_success",
         {"username": user.username},
         request
     )
     
+    user_data = user.to_dict()
+    db.commit()
+    
     # Generate tokens
-    access_token = create_access_token(data={"sub": user.username})
-    refresh_token = create_refresh_token(data={"sub": user.username})
+    access_token = create_access_token(data={"sub": user_data["username"]})
+    refresh_token = create_refresh_token(data={"sub": user_data["username"]})
     
-    logger.info(f"User logged in: {user.username}")
+    logger.info(f"User logged in: {user_data['username']}")
     
     return {
         "access_token": access_token,
         "refresh_token": refresh_token,
         "token_type": "bearer",
-        "user": user.to_dict()
+        "user": user_data
     }
 
 
@@ -260,8 +317,8 @@ async def logout(
         Success message
     """
     # Create audit log
-    create_audit_log(
-        db, current_user.id, "logout",
+    queue_audit_log(
+        current_user.id, "logout",
         {"username": current_user.username},
         request
     )
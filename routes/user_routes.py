@@ -2,15 +2,19 @@
 User API routes for managing YouTube credentials and downloads.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Request
-from sqlalchemy.orm import Session
+import asyncio
+from fastapi import APIRouter, Depends, HTTPException, Query, status, Request, Response
+from sqlalchemy.orm import Session, defer
 from pydantic import BaseModel, EmailStr, Field
 from typing import List, Optional
 from database import get_db
 from models import User, YouTubeCredential, Download, AuditLog
+from models.download_history import DOWNLOAD_LIST_COLUMNS
 from auth.dependencies import get_current_active_user
 from auth.cookie_manager import CookieManager
 from utils.logging_config import get_logger
+from utils.pagination import NEXT_CURSOR_HEADER, keyset_page
+from routes.admin_routes import invalidate_system_stats
 from datetime import datetime
 from config import settings
 
@@ -52,17 +56,15 @@ class UserStatsResponse(BaseModel):
 
 
 def create_audit_log(db: Session, user_id: int, action: str, resource_type: str, resource_id: int = None, details: dict = None):
-    """Helper to create audit log entry."""
+    """Helper to add an audit log entry; committed by the caller together with its change."""
     log = AuditLog(
         user_id=user_id,
         action=action,
         resource_type=resource_type,
-        resource_id=resource_id
+        resource_id=resource_id,
+        details=details
     )
-    if details:
-        log.set_details(details)
     db.add(log)
-    db.commit()
 
 
 @router.post("/credentials", response_model=CredentialResponse, status_code=status.HTTP_201_CREATED)
@@ -83,7 +85,7 @@ async def add_credential(
         Created credential
     """
     # Check if credential with this email already exists for user
-    existing = db.query(YouTubeCredential).filter(
+    existing = db.query(YouTubeCredential.id).filter(
         YouTubeCredential.user_id == current_user.id,
         YouTubeCredential.account_email == request_data.account_email
     ).first()
@@ -108,18 +110,21 @@ async def add_credential(
         )
         
         db.add(credential)
-        db.commit()
-        db.refresh(credential)
+        db.flush()  # Assign credential.id (and created_at) for the audit log and response
         
-        # Create audit log
+        # Create audit log (committed together with the credential)
         create_audit_log(
             db, current_user.id, "credential_added", "youtube_credential",
             credential.id, {"account_email": request_data.account_email}
         )
         
+        credential_data = credential.to_dict()
+        db.commit()
+        invalidate_system_stats()
+        
         logger.info(f"User {current_user.username} added YouTube credential: {request_data.account_email}")
         
-        return credential.to_dict()
+        return credential_data
         
     except Exception as e:
         logger.error(f"Failed to add credential: {e}")
@@ -144,7 +149,10 @@ async def get_credentials(
     Returns:
         List of credentials
     """
-    credentials = db.query(YouTubeCredential).filter(
+    # The encrypted cookie blob is never part of the listing; leave it in the database
+    credentials = db.query(YouTubeCredential).options(
+        defer(YouTubeCredential.encrypted_cookies)
+    ).filter(
         YouTubeCredential.user_id == current_user.id
     ).all()
     
@@ -179,16 +187,19 @@ async def delete_credential(
             detail="Credential not found"
         )
     
-    # Create audit log before deleting
+    account_email = credential.account_email
+    
+    # Create audit log (committed together with the delete)
     create_audit_log(
         db, current_user.id, "credential_deleted", "youtube_credential",
-        credential.id, {"account_email": credential.account_email}
+        credential.id, {"account_email": account_email}
     )
     
     db.delete(credential)
     db.commit()
+    invalidate_system_stats()
     
-    logger.info(f"User {current_user.username} deleted YouTube credential: {credential.account_email}")
+    logger.info(f"User {current_user.username} deleted YouTube credential: {account_email}")
     
     return {"message": "Credential deleted successfully"}
 
@@ -258,8 +269,10 @@ async def validate_credential(
 
 @router.get("/downloads", response_model=List[dict])
 async def get_user_downloads(
+    response: Response,
     skip: int = 0,
     limit: int = 50,
+    cursor: Optional[int] = Query(None, ge=1),
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
@@ -267,19 +280,25 @@ async def get_user_downloads(
     Get download history for current user.
     
     Args:
-        skip: Number of records to skip
+        response: Outgoing response (carries the next page cursor header)
+        skip: Number of records to skip (ignored when cursor is given)
         limit: Maximum number of records to return
+        cursor: Download id of the last row of the previous page
         current_user: Current authenticated user
         db: Database session
         
     Returns:
         List of downloads
     """
-    downloads = db.query(Download).filter(
-        Download.user_id == current_user.id
-    ).order_by(Download.created_at.desc()).offset(skip).limit(limit).all()
+    downloads, next_cursor = keyset_page(
+        db.query(*DOWNLOAD_LIST_COLUMNS).filter(Download.user_id == current_user.id),
+        Download.id, limit, cursor, skip
+    )
+    
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = str(next_cursor)
     
-    return [download.to_dict() for download in downloads]
+    return [row._asdict() for row in downloads]
 
 
 @router.get("/stats", response_model=UserStatsResponse)
@@ -350,21 +369,27 @@ async def change_password(
     """
     from auth.auth_utils import verify_password, get_password_hash
     
-    # Verify current password
-    if not verify_password(request.current_password, current_user.password_hash):
+    loop = asyncio.get_running_loop()
+    
+    # Verify current password (bcrypt runs in the default executor)
+    if not await loop.run_in_executor(
+        None, verify_password, request.current_password, current_user.password_hash
+    ):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Incorrect current password"
         )
     
     # Update password
-    current_user.password_hash = get_password_hash(request.new_password)
-    db.commit()
+    current_user.password_hash = await loop.run_in_executor(
+        None, get_password_hash, request.new_password
+    )
     
     create_audit_log(
         db, current_user.id, "password_changed", "user",
         current_user.id
     )
+    db.commit()
     
     logger.info(f"User {current_user.username} changed their password")
     
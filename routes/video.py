@@ -2,11 +2,17 @@
 Video operation API routes.
 """
 
-from fastapi import APIRouter, HTTPException, Query, Path, BackgroundTasks
-from fastapi.responses import FileResponse
+import asyncio
+import hashlib
+import secrets
+import time
+from collections import Counter
+from fastapi import APIRouter, Depends, HTTPException, Query, Path
+from fastapi.responses import FileResponse, StreamingResponse
 from typing import Optional
 from pathlib import Path as FilePath
 import os
+import stat
 from download.models import (
     VideoInfoRequest, VideoInfoResponse,
     DownloadRequest, DownloadResponse, DownloadStatus,
@@ -18,11 +24,16 @@ from download.models import (
 )
 from download.downloader import VideoDownloader
 from download.queue import DownloadQueue
+from download.playlist_tracker import playlist_tracker
 from auth.session import SessionManager
 from auth.cookie_manager import CookieManager
 from utils.logging_config import get_logger
 from utils.errors import InvalidURLError, VideoUnavailableError, DownloadError, RateLimitError
-import uuid
+from utils.validators import validate_youtube_url
+from database import SessionLocal
+from models.settings import settings_cache
+from utils.cache import TTLCache
+from utils.cleanup_scheduler import cleanup_scheduler
 
 logger = get_logger(__name__)
 
@@ -35,28 +46,148 @@ downloader: Optional[VideoDownloader] = None
 session_manager: Optional[SessionManager] = None
 cookie_manager: Optional[CookieManager] = None
 
+# Per-session concurrent download limit (set at startup from config)
+max_concurrent_downloads: int = 3
+
 
 def init_video_routes(
     queue: DownloadQueue,
     dl: VideoDownloader,
     sessions: SessionManager,
-    cookies: CookieManager
+    cookies: CookieManager,
+    max_concurrent: int = 3
 ):
     """Initialize route dependencies."""
-    global download_queue, downloader, session_manager, cookie_manager
+    global download_queue, downloader, session_manager, cookie_manager, max_concurrent_downloads
     download_queue = queue
     downloader = dl
     session_manager = sessions
     cookie_manager = cookies
+    max_concurrent_downloads = max_concurrent
+
+
+class DownloadFileResponse(FileResponse):
+    """FileResponse that reads large media files in 1 MiB chunks instead of 64 KiB."""
+    chunk_size = 1024 * 1024
+
+
+def _stat_file(path: FilePath) -> Optional[os.stat_result]:
+    """Stat a regular file, returning None if it is missing."""
+    try:
+        stat_result = os.stat(path)
+    except OSError:
+        return None
+    return stat_result if stat.S_ISREG(stat_result.st_mode) else None
+
+
+def _make_id() -> str:
+    """
+    Generate a short, time-sortable tracking ID.
+    
+    Millisecond timestamp (hex) plus 64 random bits: cheaper than uuid4 and
+    still unguessable, since the ID alone grants access to progress.
+    """
+    return f"{time.time_ns() // 1_000_000:x}{secrets.token_hex(8)}"
+
+
+# yt-dlp extraction results keyed by (url, cookie fingerprint); the UI fetches
+# info and then downloads the same URL moments later
+video_info_cache = TTLCache(ttl=600, maxsize=2000)
+playlist_info_cache = TTLCache(ttl=600, maxsize=1000)
+
+
+def _metadata_key(url: str, cookies: Optional[str]) -> tuple:
+    """Cache key for extraction results (cookies can change what is visible)."""
+    fingerprint = hashlib.blake2b(cookies.encode(), digest_size=8).hexdigest() if cookies else None
+    return url, fingerprint
+
+
+async def fetch_video_info(url: str, cookies: Optional[str]) -> VideoInfoResponse:
+    """
+    Get video info, reusing a recent extraction for the same URL.
+    
+    Args:
+        url: Video URL
+        cookies: Optional cookie file contents
+        
+    Returns:
+        Video information
+    """
+    key = _metadata_key(url, cookies)
+    info = video_info_cache.get(key)
+    if info is None:
+        info = await downloader.get_video_info(url, cookies)
+        video_info_cache.set(key, info)
+    return info
+
+
+async def fetch_playlist_info(url: str, cookies: Optional[str]) -> PlaylistInfoResponse:
+    """
+    Get playlist info, reusing a recent extraction for the same URL.
+    
+    Args:
+        url: Playlist URL
+        cookies: Optional cookie file contents
+        
+    Returns:
+        Playlist information
+    """
+    key = _metadata_key(url, cookies)
+    info = playlist_info_cache.get(key)
+    if info is None:
+        info = await downloader.get_playlist_info(url, cookies)
+        playlist_info_cache.set(key, info)
+    return info
+
+
+def clear_metadata_cache():
+    """Drop all cached video and playlist extraction results."""
+    video_info_cache.invalidate()
+    playlist_info_cache.invalidate()
+
+
+# peek() result when the cookies setting is not cached yet
+_NOT_CACHED = object()
+
+
+def _fetch_global_cookies() -> Optional[str]:
+    """Load the global cookies setting through the cache (blocking on a miss)."""
+    try:
+        with SessionLocal() as db:
+            return settings_cache.get(db, "youtube_cookies") or None
+    except Exception as e:
+        logger.error(f"Failed to fetch global cookies: {e}")
+        return None
+
+
+async def get_global_cookies() -> Optional[str]:
+    """
+    Get the admin-configured global YouTube cookies (route dependency).
+    
+    Served from the in-process settings cache, which update_setting
+    invalidates; on a miss the query runs in the default executor so the
+    event loop is never blocked on the database.
+    
+    Returns:
+        Netscape cookie file contents, or None if not configured
+    """
+    cookies = settings_cache.peek("youtube_cookies", _NOT_CACHED)
+    if cookies is _NOT_CACHED:
+        cookies = await asyncio.get_running_loop().run_in_executor(None, _fetch_global_cookies)
+    return cookies or None
 
 
 @router.post("/video/info", response_model=VideoInfoResponse)
-async def get_video_info(request: VideoInfoRequest):
+async def get_video_info(
+    request: VideoInfoRequest,
+    cookies: Optional[str] = Depends(get_global_cookies)
+):
     """
     Get video metadata and available formats.
     
     Args:
         request: Video info request with URL and optional session ID
+        cookies: Global YouTube cookies, if configured
         
     Returns:
         Video information including available formats
@@ -65,23 +196,11 @@ async def get_video_info(request: VideoInfoRequest):
         raise HTTPException(status_code=500, detail="Downloader not initialized")
     
     try:
-        # Get cookies if available
-        cookies = None
-        
-        # New Global Cookie Logic
-        try:
-            from database import SessionLocal
-            from models import AppSetting
-            
-            with SessionLocal() as db:
-                cookie_setting = db.query(AppSetting).filter(AppSetting.key == "youtube_cookies").first()
-                if cookie_setting and cookie_setting.value:
-                    cookies = cookie_setting.value
-        except Exception as e:
-            logger.error(f"Failed to fetch global cookies: {e}")
+        # Reject non-YouTube URLs before any cache, yt-dlp or queue work
+        validate_youtube_url(request.url)
         
         # Get video info
-        video_info = await downloader.get_video_info(request.url, cookies)
+        video_info = await fetch_video_info(request.url, cookies)
         
         logger.info(f"Retrieved info for video: {video_info.title}")
         return video_info
@@ -108,12 +227,16 @@ async def get_video_info(request: VideoInfoRequest):
 
 
 @router.post("/video/download", response_model=DownloadResponse)
-async def initiate_download(request: DownloadRequest):
+async def initiate_download(
+    request: DownloadRequest,
+    cookies: Optional[str] = Depends(get_global_cookies)
+):
     """
     Initiate video download.
     
     Args:
         request: Download request with URL and format options
+        cookies: Global YouTube cookies, if configured
         
     Returns:
         Download ID and status
@@ -122,6 +245,9 @@ async def initiate_download(request: DownloadRequest):
         raise HTTPException(status_code=500, detail="Download service not initialized")
     
     try:
+        # Reject non-YouTube URLs before touching the session or the queue
+        validate_youtube_url(request.url)
+        
         # Check if session exists and get download limit
         session_id = request.session_id
         session = None
@@ -132,29 +258,13 @@ async def initiate_download(request: DownloadRequest):
             
             # Check concurrent download limit
             active_count = session_manager.get_active_download_count(session_id)
-            max_concurrent = 3  # Should come from config
             
-            if active_count >= max_concurrent:
+            if active_count >= max_concurrent_downloads:
                 raise HTTPException(
                     status_code=429,
-                    detail=f"Maximum concurrent downloads ({max_concurrent}) reached"
+                    detail=f"Maximum concurrent downloads ({max_concurrent_downloads}) reached"
                 )
         
-        # Get cookies if available
-        cookies = None
-        
-        # New Global Cookie Logic
-        try:
-            from database import SessionLocal
-            from models import AppSetting
-            
-            with SessionLocal() as db:
-                cookie_setting = db.query(AppSetting).filter(AppSetting.key == "youtube_cookies").first()
-                if cookie_setting and cookie_setting.value:
-                    cookies = cookie_setting.value
-        except Exception as e:
-            logger.error(f"Failed to fetch global cookies: {e}")
-        
         # Add to download queue
         user_id = session.get('user_id') if session else None
         
@@ -180,6 +290,10 @@ async def initiate_download(request: DownloadRequest):
     except HTTPException:
         raise
     
+    except InvalidURLError as e:
+        logger.warning(f"Invalid URL: {request.url}")
+        raise HTTPException(status_code=400, detail=str(e))
+    
     except Exception as e:
         logger.error(f"Error initiating download: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -207,6 +321,61 @@ async def get_download_progress(download_id: str = Path(...)):
     return progress
 
 
+# Statuses after which a download's progress no longer changes
+FINAL_STATUSES = {DownloadStatus.COMPLETED, DownloadStatus.FAILED, DownloadStatus.CANCELLED}
+
+# Seconds between SSE comment lines that keep idle proxies from closing the stream
+SSE_KEEPALIVE_INTERVAL = 15
+
+
+async def _progress_events(download_id: str):
+    """Yield server-sent events for a download until it reaches a final status."""
+    queue = download_queue.subscribe(download_id)
+    try:
+        progress = download_queue.get_download_progress(download_id)
+        while progress is not None:
+            yield f"data: {progress.model_dump_json()}\n\n"
+            if progress.status in FINAL_STATUSES:
+                break
+            
+            while True:
+                try:
+                    progress = await asyncio.wait_for(queue.get(), SSE_KEEPALIVE_INTERVAL)
+                    break
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+    finally:
+        download_queue.unsubscribe(download_id, queue)
+
+
+@router.get("/download/events/{download_id}")
+async def stream_download_progress(download_id: str = Path(...)):
+    """
+    Stream download progress as server-sent events.
+    
+    Pushes a ProgressUpdate whenever it changes and closes once the download
+    completes, fails or is cancelled. Prefer this over polling
+    /download/progress/{download_id}, which is kept for compatibility.
+    
+    Args:
+        download_id: Download identifier
+        
+    Returns:
+        text/event-stream response
+    """
+    if not download_queue:
+        raise HTTPException(status_code=500, detail="Download service not initialized")
+    
+    if not download_queue.get_download_progress(download_id):
+        raise HTTPException(status_code=404, detail="Download not found")
+    
+    return StreamingResponse(
+        _progress_events(download_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.get("/download/status/{download_id}", response_model=DownloadStatusResponse)
 async def get_download_status(download_id: str = Path(...)):
     """
@@ -287,16 +456,12 @@ async def get_queue_status():
 
 
 @router.get("/download/file/{download_id}")
-async def serve_downloaded_file(
-    download_id: str = Path(...), 
-    background_tasks: BackgroundTasks = BackgroundTasks()
-):
+async def serve_downloaded_file(download_id: str = Path(...)):
     """
     Serve the downloaded file to the client and delete it afterwards (auto-cleanup).
     
     Args:
         download_id: Download identifier
-        background_tasks: FastAPI background tasks handler
         
     Returns:
         FileResponse with the downloaded file
@@ -312,44 +477,27 @@ async def serve_downloaded_file(
     if progress.status != DownloadStatus.COMPLETED:
         raise HTTPException(status_code=400, detail=f"Download not yet completed (Status: {progress.status})")
         
-    if not progress.filename:
+    # Absolute path resolved when the download completed
+    output_file = download_queue.get_output_file(download_id)
+    if not output_file:
         raise HTTPException(status_code=404, detail="File path not found in download record")
     
-    # Check if we can find the file path
-    file_path = FilePath(progress.filename)
-    if not file_path.exists():
-        # Try resolving relative to output dir if absolute path fails
-        from config import settings
-        file_path = settings.download_output_dir / progress.filename
-        
-    if not file_path.exists():
+    # Single stat; the result is reused by the response
+    file_path = FilePath(output_file)
+    stat_result = _stat_file(file_path)
+    if stat_result is None:
         logger.error(f"File not found on disk: {file_path}")
         raise HTTPException(status_code=404, detail="File not found on server")
     
-    # Define cleanup function
-    import asyncio
-    async def cleanup_file(path: FilePath):
-        try:
-            # Wait for 1 hour before deleting to allow slow downloads and retries
-            await asyncio.sleep(3600)
-            if path.exists():
-                os.unlink(path)
-                logger.info(f"Auto-cleanup: Deleted file {path}")
-        except Exception as e:
-            logger.error(f"Auto-cleanup failed for {path}: {e}")
-            
-    # Add cleanup task to background response
-    if background_tasks is None:
-        background_tasks = BackgroundTasks()
-        
-    background_tasks.add_task(cleanup_file, file_path)
+    # Delete after 1 hour to allow slow downloads and retries
+    cleanup_scheduler.schedule(file_path, 3600)
         
     # Valid file found, serve it
-    return FileResponse(
+    return DownloadFileResponse(
         path=file_path,
         filename=file_path.name,
         media_type="application/octet-stream",
-        background=background_tasks
+        stat_result=stat_result
     )
 
 
@@ -358,12 +506,16 @@ async def serve_downloaded_file(
 # =============================================================================
 
 @router.post("/playlist/info")
-async def get_playlist_info(request: PlaylistInfoRequest):
+async def get_playlist_info(
+    request: PlaylistInfoRequest,
+    cookies: Optional[str] = Depends(get_global_cookies)
+):
     """
     Get playlist metadata and video list.
     
     Args:
         request: Playlist info request with URL and optional session ID
+        cookies: Global YouTube cookies, if configured
         
     Returns:
         Playlist information including video list
@@ -372,21 +524,8 @@ async def get_playlist_info(request: PlaylistInfoRequest):
         raise HTTPException(status_code=500, detail="Downloader not initialized")
     
     try:
-        # Get cookies if available
-        cookies = None
-        try:
-            from database import SessionLocal
-            from models import AppSetting
-            
-            with SessionLocal() as db:
-                cookie_setting = db.query(AppSetting).filter(AppSetting.key == "youtube_cookies").first()
-                if cookie_setting and cookie_setting.value:
-                    cookies = cookie_setting.value
-        except Exception as e:
-            logger.error(f"Failed to fetch global cookies: {e}")
-        
         # Get playlist info
-        playlist_info = await downloader.get_playlist_info(request.url, cookies)
+        playlist_info = await fetch_playlist_info(request.url, cookies)
         
         logger.info(f"Retrieved info for playlist: {playlist_info.title} ({playlist_info.video_count} videos)")
         return playlist_info
@@ -405,12 +544,16 @@ async def get_playlist_info(request: PlaylistInfoRequest):
 
 
 @router.post("/playlist/download")
-async def initiate_playlist_download(request: PlaylistDownloadRequest):
+async def initiate_playlist_download(
+    request: PlaylistDownloadRequest,
+    cookies: Optional[str] = Depends(get_global_cookies)
+):
     """
     Initiate playlist download.
     
     Args:
         request: Playlist download request with URL and format options
+        cookies: Global YouTube cookies, if configured
         
     Returns:
         Playlist download ID and list of individual download IDs
@@ -419,21 +562,8 @@ async def initiate_playlist_download(request: PlaylistDownloadRequest):
         raise HTTPException(status_code=500, detail="Download service not initialized")
     
     try:
-        # Get cookies if available
-        cookies = None
-        try:
-            from database import SessionLocal
-            from models import AppSetting
-            
-            with SessionLocal() as db:
-                cookie_setting = db.query(AppSetting).filter(AppSetting.key == "youtube_cookies").first()
-                if cookie_setting and cookie_setting.value:
-                    cookies = cookie_setting.value
-        except Exception as e:
-            logger.error(f"Failed to fetch global cookies: {e}")
-        
         # Get playlist info to get video list
-        playlist_info = await downloader.get_playlist_info(request.url, cookies)
+        playlist_info = await fetch_playlist_info(request.url, cookies)
         
         # Determine which videos to download
         videos_to_download = playlist_info.videos
@@ -445,51 +575,36 @@ async def initiate_playlist_download(request: PlaylistDownloadRequest):
             raise HTTPException(status_code=400, detail="No videos selected for download")
         
         # Create a playlist ID for tracking
-        playlist_id = str(uuid.uuid4())
-        
-        # Queue individual video downloads
-        download_ids = []
-        for video in videos_to_download:
-            # Create download request for each video
-            video_request = DownloadRequest(
-                url=video.url,
-                format_type=request.format_type,
-                quality=request.quality,
-                audio_format=request.audio_format,
-                video_codec=request.video_codec,
-                audio_codec=request.audio_codec,
-                session_id=request.session_id
-            )
-            
-            # Add to download queue
-            # Extract user_id from session if available
-            user_id = None
-            if request.session_id and session_manager:
-                session = session_manager.get_session(request.session_id)
-                if session:
-                    user_id = session.get('user_id')
-
-            download_id = download_queue.add_download(
-                request=video_request,
-                session_id=request.session_id,
-                cookies=cookies,
-                user_id=user_id
-            )
-            download_ids.append(download_id)
-            
-            # Store playlist association (we'll need to track this)
-            # For now, we'll use a simple in-memory dict
-            if not hasattr(download_queue, 'playlist_downloads'):
-                download_queue.playlist_downloads = {}
-            
-            if playlist_id not in download_queue.playlist_downloads:
-                download_queue.playlist_downloads[playlist_id] = {
-                    'download_ids': [],
-                    'title': playlist_info.title,
-                    'total': len(videos_to_download)
-                }
-            
-            download_queue.playlist_downloads[playlist_id]['download_ids'].append(download_id)
+        playlist_id = _make_id()
+        
+        # Extract user_id from session if available (same for every video)
+        user_id = None
+        if request.session_id and session_manager:
+            session = session_manager.get_session(request.session_id)
+            if session:
+                user_id = session.get('user_id')
+        
+        # Create download request for each video; the shared options were already
+        # validated on the playlist request, so skip re-validating them per video
+        base_options = request.model_dump(exclude={'url', 'video_ids'})
+        video_requests = [
+            DownloadRequest.model_construct(url=video.url, **base_options)
+            for video in videos_to_download
+        ]
+        
+        # Queue all video downloads in one pass
+        download_ids = download_queue.add_downloads(
+            video_requests,
+            session_id=request.session_id,
+            cookies=cookies,
+            user_id=user_id
+        )
+        
+        # Store playlist association in the database so every worker can report on it
+        await asyncio.get_running_loop().run_in_executor(
+            None, playlist_tracker.create,
+            playlist_id, playlist_info.title, len(videos_to_download), download_ids
+        )
         
         logger.info(f"Playlist download initiated: {playlist_id} with {len(download_ids)} videos")
         
@@ -522,34 +637,25 @@ async def get_playlist_progress(playlist_id: str = Path(...)):
     if not download_queue:
         raise HTTPException(status_code=500, detail="Download service not initialized")
     
-    # Get playlist info from tracking dict
-    if not hasattr(download_queue, 'playlist_downloads'):
-        raise HTTPException(status_code=404, detail="Playlist not found")
-    
-    playlist_data = download_queue.playlist_downloads.get(playlist_id)
+    # Get playlist info from the shared tracking table
+    playlist_data = await asyncio.get_running_loop().run_in_executor(
+        None, playlist_tracker.get, playlist_id
+    )
     if not playlist_data:
         raise HTTPException(status_code=404, detail="Playlist not found")
     
-    # Get progress for each video
-    video_progress_list = []
-    completed = 0
-    failed = 0
-    downloading = 0
-    pending = 0
-    
-    for download_id in playlist_data['download_ids']:
-        progress = download_queue.get_download_progress(download_id)
-        if progress:
-            video_progress_list.append(progress)
-            
-            if progress.status == DownloadStatus.COMPLETED:
-                completed += 1
-            elif progress.status == DownloadStatus.FAILED:
-                failed += 1
-            elif progress.status == DownloadStatus.DOWNLOADING:
-                downloading += 1
-            elif progress.status == DownloadStatus.PENDING:
-                pending += 1
+    # Per-video progress lives in the queue of the worker that enqueued the
+    # playlist; other workers know the playlist but none of its downloads
+    video_progress_list = download_queue.get_progress_many(playlist_data['download_ids'])
+    if playlist_data['download_ids'] and not video_progress_list:
+        raise HTTPException(status_code=404, detail="Playlist downloads not found")
+    
+    # Count videos by status in one pass
+    status_counts = Counter(progress.status for progress in video_progress_list)
+    completed = status_counts[DownloadStatus.COMPLETED]
+    failed = status_counts[DownloadStatus.FAILED]
+    downloading = status_counts[DownloadStatus.DOWNLOADING]
+    pending = status_counts[DownloadStatus.PENDING]
     
     # Calculate overall progress
     total = playlist_data['total']
@@ -16,26 +16,28 @@ def update_settings():
     db = SessionLocal()
     try:
         logger.info("Checking for missing default settings...")
-        count = 0
+        
+        # One SELECT for every existing key instead of one per default
+        existing = {
+            row.key: row for row in db.query(AppSetting.id, AppSetting.key, AppSetting.value_type).all()
+        }
+        
+        missing = [default for default in DEFAULT_SETTINGS if default['key'] not in existing]
+        for default in missing:
+            logger.info(f"Adding missing setting: {default['key']}")
+        
+        # Optional: Update type if changed
+        type_updates = []
         for default in DEFAULT_SETTINGS:
-            existing = db.query(AppSetting).filter(AppSetting.key == default['key']).first()
-            if not existing:
-                logger.info(f"Adding missing setting: {default['key']}")
-                setting = AppSetting(
-                    key=default['key'],
-                    value=default['value'],
-                    category=default['category'],
-                    description=default['description'],
-                    value_type=default['value_type']
-                )
-                db.add(setting)
-                count += 1
-            else:
-                # Optional: Update description or type if changed
-                if existing.value_type != default['value_type']:
-                     logger.info(f"Updating type for setting: {default['key']}")
-                     existing.value_type = default['value_type']
-                     count += 1
+            row = existing.get(default['key'])
+            if row and row.value_type != default['value_type']:
+                logger.info(f"Updating type for setting: {default['key']}")
+                type_updates.append({'id': row.id, 'value_type': default['value_type']})
+        
+        # Batched INSERT/UPDATE without per-object unit-of-work overhead
+        db.bulk_insert_mappings(AppSetting, missing)
+        db.bulk_update_mappings(AppSetting, type_updates)
+        count = len(missing) + len(type_updates)
         
         if count > 0:
             db.commit()
@@ -8,6 +8,7 @@ class DownloadManager {
         this.currentVideoInfo = null;
         this.currentDownloadId = null;
         this.progressInterval = null;
+        this.progressSource = null;
 
         this.init();
     }
@@ -187,8 +188,8 @@ class DownloadManager {
             window.ui.showProgress();
             window.ui.updateProgress(0, 'Download queued...');
 
-            // Start polling for progress
-            this.startProgressPolling();
+            // Start listening for progress
+            this.startProgressUpdates();
 
             window.ui.showToast('success', 'Download Started', 'Your download has been queued');
         } catch (error) {
@@ -210,6 +211,36 @@ class DownloadManager {
         }
     }
 
+    /**
+     * Start receiving download progress (server-sent events, polling as fallback)
+     */
+    startProgressUpdates() {
+        this.stopProgressPolling();
+
+        if (!window.EventSource) {
+            this.startProgressPolling();
+            return;
+        }
+
+        const source = new EventSource(`/api/download/events/${this.currentDownloadId}`);
+        this.progressSource = source;
+
+        source.onmessage = (event) => {
+            this.handleProgress(JSON.parse(event.data));
+        };
+
+        source.onerror = () => {
+            // Stream closed or unavailable; fall back to polling if still in progress
+            source.close();
+            if (this.progressSource === source) {
+                this.progressSource = null;
+                if (this.currentDownloadId) {
+                    this.startProgressPolling();
+                }
+            }
+        };
+    }
+
     /**
      * Start polling for download progress
      */
@@ -227,6 +258,10 @@ class DownloadManager {
      * Stop polling for download progress
      */
     stopProgressPolling() {
+        if (this.progressSource) {
+            this.progressSource.close();
+            this.progressSource = null;
+        }
         if (this.progressInterval) {
             clearInterval(this.progressInterval);
             this.progressInterval = null;
@@ -244,59 +279,66 @@ class DownloadManager {
 
         try {
             const progress = await window.api.getDownloadProgress(this.currentDownloadId);
-
-            // Update progress bar
-            const percent = progress.progress || 0;
-            let status = progress.status || 'pending';
-
-            // Status messages
-            const statusMessages = {
-                'pending': 'Waiting in queue...',
-                'downloading': 'Downloading...',
-                'processing': 'Processing video...',
-                'completed': 'Download completed!',
-                'failed': 'Download failed',
-                'cancelled': 'Download cancelled'
-            };
-
-            const statusText = statusMessages[status] || status;
-
-            // Format details
-            const details = {};
-            if (progress.speed) {
-                details.speed = this.formatSpeed(progress.speed);
-            }
-            if (progress.eta) {
-                details.eta = this.formatETA(progress.eta);
-            }
-
-            window.ui.updateProgress(percent, statusText, details);
-
-            // Check if download is complete or failed
-            if (status === 'completed') {
-                this.stopProgressPolling();
-                window.ui.showToast('success', 'Download Complete', 'Your video has been downloaded successfully');
-
-                // Reset after 3 seconds
-                setTimeout(() => {
-                    this.resetDownload();
-                }, 3000);
-            } else if (status === 'failed') {
-                this.stopProgressPolling();
-                const errorMsg = progress.error || 'Unknown error';
-                window.ui.showToast('error', 'Download Failed', errorMsg);
-
-                // Reset after 3 seconds
-                setTimeout(() => {
-                    this.resetDownload();
-                }, 3000);
-            }
+            this.handleProgress(progress);
         } catch (error) {
             console.error('Failed to get download progress:', error);
             // Don't stop polling on error, just log it
         }
     }
 
+    /**
+     * Render a progress update
+     * @param {object} progress - ProgressUpdate from the API
+     */
+    handleProgress(progress) {
+        // Update progress bar
+        const percent = progress.progress || 0;
+        let status = progress.status || 'pending';
+
+        // Status messages
+        const statusMessages = {
+            'pending': 'Waiting in queue...',
+            'downloading': 'Downloading...',
+            'processing': 'Processing video...',
+            'completed': 'Download completed!',
+            'failed': 'Download failed',
+            'cancelled': 'Download cancelled'
+        };
+
+        const statusText = statusMessages[status] || status;
+
+        // Format details
+        const details = {};
+        if (progress.speed) {
+            details.speed = this.formatSpeed(progress.speed);
+        }
+        if (progress.eta) {
+            details.eta = this.formatETA(progress.eta);
+        }
+
+        window.ui.updateProgress(percent, statusText, details);
+
+        // Check if download is complete or failed
+        if (status === 'completed') {
+            this.stopProgressPolling();
+            window.ui.showToast('success', 'Download Complete', 'Your video has been downloaded successfully');
+
+            // Reset after 3 seconds
+            setTimeout(() => {
+                this.resetDownload();
+            }, 3000);
+        } else if (status === 'failed') {
+            this.stopProgressPolling();
+            const errorMsg = progress.error || 'Unknown error';
+            window.ui.showToast('error', 'Download Failed', errorMsg);
+
+            // Reset after 3 seconds
+            setTimeout(() => {
+                this.resetDownload();
+            }, 3000);
+        }
+    }
+
     /**
      * Reset download state
      */
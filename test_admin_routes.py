@@ -0,0 +1,37 @@
+"""
+Tests for admin maintenance endpoints.
+"""
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from auth.dependencies import get_current_admin_user
+from database import get_db
+from models import AuditLog, User
+from routes import admin_routes
+
+
+def test_delete_all_logs_leaves_only_the_clear_entry(session_factory):
+    with session_factory() as db:
+        admin = User(username="admin", email="admin@example.com", password_hash="x")
+        db.add(admin)
+        db.flush()
+        db.add_all(AuditLog(user_id=admin.id, action=f"action_{i}") for i in range(3))
+        db.commit()
+        admin_id = admin.id
+
+    app = FastAPI()
+    app.include_router(admin_routes.router)
+
+    def override_db():
+        with session_factory() as db:
+            yield db
+
+    app.dependency_overrides[get_db] = override_db
+    app.dependency_overrides[get_current_admin_user] = lambda: User(id=admin_id, username="admin")
+
+    with TestClient(app) as client:
+        assert client.delete("/admin/logs").status_code == 200
+
+    with session_factory() as db:
+        assert [(log.action, log.user_id) for log in db.query(AuditLog)] == [("logs_cleared", admin_id)]
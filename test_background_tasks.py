@@ -0,0 +1,188 @@
+"""
+Tests for the background audit writer, cleanup scheduler and playlist tracker.
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import update
+
+from download import playlist_tracker as playlist_tracker_module
+from download.models import DownloadRequest
+from download.playlist_tracker import PlaylistTracker
+from download.queue import DownloadQueue
+from models import AuditLog, PlaylistDownload
+from routes import video
+from utils import audit_writer as audit_writer_module
+from utils.audit_writer import AuditLogWriter
+from utils.cleanup_scheduler import CleanupScheduler
+
+URL = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+
+
+# Audit writer
+
+def test_audit_writer_batches_rows(session_factory, monkeypatch):
+    monkeypatch.setattr(audit_writer_module, "SessionLocal", session_factory)
+    writer = AuditLogWriter(flush_interval=0.01)
+
+    async def run():
+        await writer.start()
+        for i in range(5):
+            writer.enqueue(action=f"action_{i}", user_id=None)
+        await writer.stop()
+
+    asyncio.run(run())
+
+    with session_factory() as db:
+        assert [log.action for log in db.query(AuditLog).order_by(AuditLog.id)] == [
+            f"action_{i}" for i in range(5)
+        ]
+
+
+def test_audit_writer_buffers_until_started(session_factory, monkeypatch):
+    monkeypatch.setattr(audit_writer_module, "SessionLocal", session_factory)
+    writer = AuditLogWriter(flush_interval=0.01)
+
+    writer.enqueue(action="before_start")
+    with session_factory() as db:
+        assert db.query(AuditLog).count() == 0
+
+    async def run():
+        await writer.start()
+        writer.enqueue(action="after_start")
+        await writer.stop()
+
+    asyncio.run(run())
+
+    with session_factory() as db:
+        assert [log.action for log in db.query(AuditLog).order_by(AuditLog.id)] == [
+            "before_start", "after_start"
+        ]
+
+
+def test_audit_writer_caps_buffer_before_start(session_factory, monkeypatch):
+    monkeypatch.setattr(audit_writer_module, "SessionLocal", session_factory)
+    writer = AuditLogWriter(flush_interval=0.01, max_pending=2)
+
+    for i in range(4):
+        writer.enqueue(action=f"queued_{i}")
+
+    async def run():
+        await writer.start()
+        await writer.stop()
+
+    asyncio.run(run())
+
+    with session_factory() as db:
+        assert [log.action for log in db.query(AuditLog).order_by(AuditLog.id)] == ["queued_2", "queued_3"]
+
+
+def test_audit_writer_flushes_rows_behind_stop_and_after_stop(session_factory, monkeypatch):
+    monkeypatch.setattr(audit_writer_module, "SessionLocal", session_factory)
+    writer = AuditLogWriter(flush_interval=0.01)
+
+    async def run():
+        await writer.start()
+        stopping = asyncio.create_task(writer.stop())
+        await asyncio.sleep(0)
+        writer.enqueue(action="during_stop")
+        await stopping
+        writer.enqueue(action="after_stop")
+
+    asyncio.run(run())
+
+    with session_factory() as db:
+        assert [log.action for log in db.query(AuditLog).order_by(AuditLog.id)] == ["during_stop", "after_stop"]
+
+
+# Cleanup scheduler
+
+def test_cleanup_scheduler_deletes_due_files_in_order(tmp_path):
+    later = tmp_path / "later.mp4"
+    sooner = tmp_path / "sooner.mp4"
+    kept = tmp_path / "kept.mp4"
+    for path in (later, sooner, kept):
+        path.write_bytes(b"data")
+
+    async def run():
+        scheduler = CleanupScheduler()
+        await scheduler.start()
+        scheduler.schedule(later, 0.1)
+        scheduler.schedule(sooner, 0.02)
+        scheduler.schedule(kept, 60)
+
+        await asyncio.sleep(0.06)
+        midway = (sooner.exists(), later.exists())
+        await asyncio.sleep(0.1)
+        await scheduler.stop()
+        return midway
+
+    assert asyncio.run(run()) == (False, True)
+    assert not later.exists()
+    assert kept.exists()
+
+
+def test_cleanup_scheduler_ignores_missing_files(tmp_path):
+    async def run():
+        scheduler = CleanupScheduler()
+        await scheduler.start()
+        scheduler.schedule(tmp_path / "gone.mp4", 0)
+        await asyncio.sleep(0.02)
+        await scheduler.stop()
+
+    asyncio.run(run())
+
+
+# Playlist tracker
+
+def test_playlist_tracker_round_trip(session_factory, monkeypatch):
+    monkeypatch.setattr(playlist_tracker_module, "SessionLocal", session_factory)
+    tracker = PlaylistTracker()
+
+    tracker.create("p1", "Mix", 2, ["a", "b"])
+
+    assert tracker.get("p1") == {"title": "Mix", "total": 2, "download_ids": ["a", "b"]}
+    assert tracker.get("unknown") is None
+
+
+def test_playlist_tracker_cleanup_old(session_factory, monkeypatch):
+    monkeypatch.setattr(playlist_tracker_module, "SessionLocal", session_factory)
+    tracker = PlaylistTracker()
+    tracker.create("old", None, 1, ["a"])
+    tracker.create("new", None, 1, ["b"])
+
+    with session_factory() as db:
+        db.execute(
+            update(PlaylistDownload)
+            .where(PlaylistDownload.playlist_id == "old")
+            .values(created_at=datetime.utcnow() - timedelta(hours=30))
+        )
+        db.commit()
+
+    assert tracker.cleanup_old(max_age_hours=24) == 1
+    assert tracker.get("old") is None
+    assert tracker.get("new") is not None
+
+
+def test_playlist_progress_unknown_downloads_is_404(session_factory, monkeypatch):
+    monkeypatch.setattr(playlist_tracker_module, "SessionLocal", session_factory)
+    queue = DownloadQueue(downloader=None)
+    monkeypatch.setattr(video, "download_queue", queue)
+
+    download_ids = queue.add_downloads([DownloadRequest(url=URL), DownloadRequest(url=URL)])
+    playlist_tracker_module.playlist_tracker.create("local", "Mix", 2, download_ids)
+    playlist_tracker_module.playlist_tracker.create("other_worker", "Mix", 2, ["x", "y"])
+
+    app = FastAPI()
+    app.include_router(video.router)
+
+    with TestClient(app) as client:
+        response = client.get("/api/playlist/progress/local")
+        assert response.status_code == 200
+        assert response.json()["pending_videos"] == 2
+
+        assert client.get("/api/playlist/progress/other_worker").status_code == 404
+        assert client.get("/api/playlist/progress/missing").status_code == 404
@@ -0,0 +1,33 @@
+"""
+Tests for upgrading databases created by older versions of the models.
+"""
+
+import pytest
+from sqlalchemy import text
+
+from database import upgrade_schema
+
+
+def _index_names(engine):
+    with engine.connect() as conn:
+        return set(conn.scalars(text("SELECT name FROM sqlite_master WHERE type = 'index'")))
+
+
+@pytest.mark.parametrize("index_name", [
+    "ix_users_role_active_created",
+    "ix_users_email_lower",
+    "ix_downloads_user_status",
+    "ix_downloads_user_recent",
+    "ix_audit_logs_action_recent",
+    "ix_audit_logs_user_recent",
+    "ix_audit_resource",
+])
+def test_upgrade_schema_adds_index_to_existing_table(session_factory, index_name):
+    engine = session_factory.kw["bind"]
+    with engine.begin() as conn:
+        conn.execute(text(f"DROP INDEX {index_name}"))
+
+    upgrade_schema(engine)
+    upgrade_schema(engine)  # safe to repeat on every startup
+
+    assert index_name in _index_names(engine)
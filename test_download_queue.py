@@ -0,0 +1,92 @@
+"""
+Tests for download queue bookkeeping and progress streaming.
+"""
+
+import asyncio
+import json
+
+from download.models import DownloadRequest, DownloadStatus, ProgressUpdate
+from download.queue import DownloadQueue
+from routes import video
+
+URL = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+
+
+def test_add_download_registers_pending_item():
+    queue = DownloadQueue(downloader=None)
+
+    download_id = queue.add_download(DownloadRequest(url=URL), session_id="s1", user_id=7)
+
+    assert queue.downloads[download_id]['status'] == DownloadStatus.PENDING
+    assert queue.downloads[download_id]['user_id'] == 7
+    assert queue.progress[download_id].progress == 0.0
+    assert queue.get_queue_size() == 1
+
+
+def test_add_downloads_matches_add_download():
+    queue = DownloadQueue(downloader=None)
+
+    download_ids = queue.add_downloads(
+        [DownloadRequest(url=URL) for _ in range(3)], session_id="s1", user_id=7
+    )
+    single_id = queue.add_download(DownloadRequest(url=URL), session_id="s1", user_id=7)
+
+    assert len(set(download_ids)) == 3
+    assert queue.get_queue_size() == 4
+    assert len({queue.downloads[i]['created_at'] for i in download_ids}) == 1
+
+    batch_keys = {k for k in queue.downloads[download_ids[0]] if k not in ('download_id', 'created_at')}
+    assert batch_keys == {k for k in queue.downloads[single_id] if k not in ('download_id', 'created_at')}
+    assert [p.download_id for p in queue.get_progress_many(download_ids + ['missing'])] == download_ids
+
+
+def test_subscriber_receives_only_latest_progress():
+    async def run():
+        queue = DownloadQueue(downloader=None)
+        queue._loop = asyncio.get_running_loop()
+        download_id = queue.add_download(DownloadRequest(url=URL))
+        listener = queue.subscribe(download_id)
+
+        for percent in (10.0, 20.0, 30.0):
+            queue._update_progress(download_id, ProgressUpdate(
+                download_id=download_id, status=DownloadStatus.DOWNLOADING, progress=percent
+            ))
+        await asyncio.sleep(0)
+
+        latest = listener.get_nowait()
+        queue.unsubscribe(download_id, listener)
+        return latest, listener.empty(), queue._subscribers
+
+    latest, drained, subscribers = asyncio.run(run())
+
+    assert latest.progress == 30.0
+    assert drained
+    assert subscribers == {}
+
+
+def test_progress_events_stream_until_final_status(monkeypatch):
+    async def run():
+        queue = DownloadQueue(downloader=None)
+        queue._loop = asyncio.get_running_loop()
+        monkeypatch.setattr(video, "download_queue", queue)
+        download_id = queue.add_download(DownloadRequest(url=URL))
+
+        async def drive():
+            await asyncio.sleep(0.01)
+            queue._update_progress(download_id, ProgressUpdate(
+                download_id=download_id, status=DownloadStatus.DOWNLOADING, progress=50.0
+            ))
+            await asyncio.sleep(0.01)
+            queue._update_status(download_id, DownloadStatus.COMPLETED)
+
+        driver = asyncio.create_task(drive())
+        events = [event async for event in video._progress_events(download_id)]
+        await driver
+        return events, queue._subscribers
+
+    events, subscribers = asyncio.run(run())
+
+    statuses = [json.loads(event[len("data: "):])['status'] for event in events]
+    assert statuses == [DownloadStatus.PENDING, DownloadStatus.DOWNLOADING, DownloadStatus.COMPLETED]
+    assert all(event.endswith("\n\n") for event in events)
+    assert subscribers == {}
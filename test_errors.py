@@ -0,0 +1,38 @@
+"""
+Tests for the application exception classes.
+"""
+
+import copy
+import pickle
+
+import pytest
+
+from utils.errors import (
+    AuthenticationError,
+    DownloadError,
+    InvalidURLError,
+    RateLimitError,
+    VideoUnavailableError,
+)
+
+
+@pytest.mark.parametrize("clone", [lambda e: pickle.loads(pickle.dumps(e)), copy.copy, copy.deepcopy])
+def test_url_errors_survive_pickle_and_copy(clone):
+    for cls in (DownloadError, InvalidURLError, VideoUnavailableError):
+        error = clone(cls("boom", url="https://youtu.be/dQw4w9WgXcQ", status_code=418))
+        assert (error.message, error.url, error.status_code) == ("boom", "https://youtu.be/dQw4w9WgXcQ", 418)
+
+
+def test_rate_limit_error_survives_pickle():
+    error = pickle.loads(pickle.dumps(RateLimitError(retry_after=30)))
+    assert (error.message, error.retry_after, error.status_code) == ("Rate limit exceeded", 30, 429)
+
+
+def test_defaults_applied():
+    error = AuthenticationError()
+    assert (error.message, error.status_code, str(error)) == ("Authentication failed", 401, "Authentication failed")
+
+
+def test_explicit_empty_message_kept():
+    error = DownloadError("", status_code=0)
+    assert (error.message, error.status_code) == ("", 0)
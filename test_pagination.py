@@ -0,0 +1,96 @@
+"""
+Tests for keyset pagination.
+"""
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from auth.dependencies import get_current_active_user
+from database import get_db
+from models import Download, User
+from models.download_history import DOWNLOAD_LIST_COLUMNS
+from routes import user_routes
+from utils.pagination import NEXT_CURSOR_HEADER, cursor_headers, keyset_page
+
+
+def _seed(db, count):
+    user = User(username="alice", email="alice@example.com", password_hash="x")
+    db.add(user)
+    db.flush()
+    db.add_all(
+        Download(download_id=f"d{i}", user_id=user.id, youtube_url="u", format_type="video")
+        for i in range(count)
+    )
+    db.commit()
+    return user.id
+
+
+def test_keyset_page_walks_all_rows_newest_first(session_factory):
+    with session_factory() as db:
+        user_id = _seed(db, 7)
+        query = db.query(*DOWNLOAD_LIST_COLUMNS).filter(Download.user_id == user_id)
+
+        seen, cursor = [], None
+        while True:
+            rows, cursor = keyset_page(query, Download.id, 3, cursor)
+            seen.extend(row.id for row in rows)
+            if cursor is None:
+                break
+
+        assert seen == sorted(seen, reverse=True)
+        assert len(seen) == 7
+
+
+def test_keyset_page_offset_matches_cursor(session_factory):
+    with session_factory() as db:
+        user_id = _seed(db, 7)
+        query = db.query(*DOWNLOAD_LIST_COLUMNS).filter(Download.user_id == user_id)
+
+        first, cursor = keyset_page(query, Download.id, 3)
+        by_cursor, _ = keyset_page(query, Download.id, 3, cursor)
+        by_offset, _ = keyset_page(query, Download.id, 3, skip=3)
+
+        assert [row.id for row in by_offset] == [row.id for row in by_cursor]
+
+
+def test_keyset_page_last_page_has_no_cursor(session_factory):
+    with session_factory() as db:
+        user_id = _seed(db, 3)
+        query = db.query(*DOWNLOAD_LIST_COLUMNS).filter(Download.user_id == user_id)
+
+        rows, cursor = keyset_page(query, Download.id, 3)
+
+        assert len(rows) == 3
+        assert cursor is None
+
+
+def test_cursor_headers():
+    assert cursor_headers(None) == {}
+    assert cursor_headers(12) == {NEXT_CURSOR_HEADER: "12"}
+
+
+def test_user_downloads_cursor_header_and_validation(session_factory):
+    with session_factory() as db:
+        user_id = _seed(db, 4)
+
+    app = FastAPI()
+    app.include_router(user_routes.router)
+
+    def override_db():
+        with session_factory() as db:
+            yield db
+
+    app.dependency_overrides[get_db] = override_db
+    app.dependency_overrides[get_current_active_user] = lambda: User(id=user_id, username="alice")
+
+    with TestClient(app) as client:
+        response = client.get("/api/user/downloads", params={"limit": 3})
+        assert response.status_code == 200
+        assert len(response.json()) == 3
+
+        cursor = response.headers[NEXT_CURSOR_HEADER]
+        response = client.get("/api/user/downloads", params={"limit": 3, "cursor": cursor})
+        assert len(response.json()) == 1
+        assert NEXT_CURSOR_HEADER not in response.headers
+
+        assert client.get("/api/user/downloads", params={"cursor": 0}).status_code == 422
@@ -0,0 +1,109 @@
+"""
+Tests for setting value parsing and the in-process settings cache.
+"""
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from auth.dependencies import get_current_admin_user
+from database import get_db
+from models import User
+from models.settings import AppSetting, SettingsCache, parse_setting_value
+from routes import admin_routes
+
+
+def test_parse_setting_value_types():
+    assert parse_setting_value("integer", "42") == 42
+    assert parse_setting_value("boolean", "true") is True
+    assert parse_setting_value("boolean", "No") is False
+    assert parse_setting_value("json", '{"a": [1]}') == {"a": [1]}
+    assert parse_setting_value("text", "raw") == "raw"
+
+
+def test_parse_setting_value_json_not_shared():
+    first = parse_setting_value("json", '{"a": [1]}')
+    first["a"].append(2)
+
+    assert parse_setting_value("json", '{"a": [1]}') == {"a": [1]}
+
+
+def test_parsed_value_reset_on_direct_assignment():
+    setting = AppSetting(key="max_retries", value="3", value_type="integer")
+    assert setting.get_value() == 3
+
+    setting.value = "5"
+    assert setting.get_value() == 5
+
+    setting.set_value(7)
+    assert setting.get_value() == 7
+
+    setting.value_type = "string"
+    assert setting.get_value() == "7"
+
+
+def test_settings_cache_reads_through_and_invalidates(session_factory):
+    cache = SettingsCache()
+    with session_factory() as db:
+        db.add(AppSetting(key="max_retries", value="3", category="download", value_type="integer"))
+        db.commit()
+
+        assert cache.get(db, "max_retries") == 3
+        assert cache.peek("max_retries") == 3
+
+        db.query(AppSetting).filter(AppSetting.key == "max_retries").update({"value": "9"})
+        db.commit()
+        assert cache.get(db, "max_retries") == 3
+
+        cache.invalidate("max_retries")
+        assert cache.peek("max_retries") is None
+        assert cache.get(db, "max_retries") == 9
+        assert cache.get(db, "missing", "fallback") == "fallback"
+
+
+def test_settings_cache_expires(session_factory):
+    cache = SettingsCache(ttl=0)
+    with session_factory() as db:
+        db.add(AppSetting(key="site_name", value="A", category="ui", value_type="string"))
+        db.commit()
+        cache.load(db)
+
+        db.query(AppSetting).filter(AppSetting.key == "site_name").update({"value": "B"})
+        db.commit()
+
+        assert cache.get(db, "site_name") == "B"
+
+
+def test_admin_settings_etag_tracks_content(session_factory):
+    with session_factory() as db:
+        db.add(AppSetting(key="site_name", value="A", category="ui", value_type="string"))
+        db.commit()
+
+    app = FastAPI()
+    app.include_router(admin_routes.router)
+
+    def override_db():
+        with session_factory() as db:
+            yield db
+
+    app.dependency_overrides[get_db] = override_db
+    app.dependency_overrides[get_current_admin_user] = lambda: User(id=1, username="admin")
+
+    with TestClient(app) as client:
+        response = client.get("/admin/settings")
+        etag = response.headers["ETag"]
+        assert response.json()[0]["value"] == "A"
+        assert client.get("/admin/settings", headers={"If-None-Match": etag}).status_code == 304
+
+        # A change whose timestamp does not move (clock skew, second-resolution
+        # timestamps) must still invalidate the ETag
+        with session_factory() as db:
+            setting = db.query(AppSetting).filter(AppSetting.key == "site_name").one()
+            db.query(AppSetting).filter(AppSetting.key == "site_name").update(
+                {"value": "B", "updated_at": setting.updated_at}
+            )
+            db.commit()
+
+        response = client.get("/admin/settings", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json()[0]["value"] == "B"
+        assert response.headers["ETag"] != etag
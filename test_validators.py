@@ -0,0 +1,208 @@
+"""
+Tests for the input validators, including their fast paths.
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from utils.errors import InvalidURLError
+from utils.validators import (
+    extract_video_id,
+    is_valid_session_id,
+    sanitize_filename,
+    validate_download_path,
+    validate_format,
+    validate_quality,
+    validate_youtube_url,
+)
+
+
+# validate_download_path
+
+def test_download_path_direct_child_accepted(tmp_path):
+    assert validate_download_path(tmp_path / "video.mp4", tmp_path)
+
+
+def test_download_path_name_with_dots_accepted(tmp_path):
+    assert validate_download_path(tmp_path / "Title... part 2.mp4", tmp_path)
+
+
+def test_download_path_nested_accepted(tmp_path):
+    assert validate_download_path(tmp_path / "sub" / "video.mp4", tmp_path)
+
+
+@pytest.mark.parametrize("parts", [
+    ("..",),
+    ("..", "etc", "passwd"),
+    ("sub", "..", "..", "outside.mp4"),
+])
+def test_download_path_parent_references_rejected(tmp_path, parts):
+    base_dir = tmp_path / "downloads"
+    base_dir.mkdir()
+    assert not validate_download_path(base_dir.joinpath(*parts), base_dir)
+
+
+def test_download_path_sibling_with_common_prefix_rejected(tmp_path):
+    base_dir = tmp_path / "downloads"
+    base_dir.mkdir()
+    assert not validate_download_path(tmp_path / "downloads2" / "video.mp4", base_dir)
+
+
+def test_download_path_outside_absolute_rejected(tmp_path):
+    base_dir = tmp_path / "downloads"
+    base_dir.mkdir()
+    assert not validate_download_path(tmp_path / "video.mp4", base_dir)
+
+
+def test_download_path_symlink_leaving_base_rejected(tmp_path):
+    base_dir = tmp_path / "downloads"
+    base_dir.mkdir()
+    outside = tmp_path / "secret.txt"
+    outside.write_text("secret")
+    link = base_dir / "video.mp4"
+    os.symlink(outside, link)
+
+    assert not validate_download_path(link, base_dir)
+
+
+def test_download_path_symlinked_subdir_leaving_base_rejected(tmp_path):
+    base_dir = tmp_path / "downloads"
+    base_dir.mkdir()
+    outside_dir = tmp_path / "elsewhere"
+    outside_dir.mkdir()
+    os.symlink(outside_dir, base_dir / "sub")
+
+    assert not validate_download_path(base_dir / "sub" / "video.mp4", base_dir)
+
+
+def test_download_path_symlink_inside_base_accepted(tmp_path):
+    base_dir = tmp_path / "downloads"
+    base_dir.mkdir()
+    target = base_dir / "real.mp4"
+    target.write_text("data")
+    link = base_dir / "video.mp4"
+    os.symlink(target, link)
+
+    assert validate_download_path(link, base_dir)
+
+
+def test_download_path_relative(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    base_dir = tmp_path / "downloads"
+    base_dir.mkdir()
+    relative_base = base_dir.relative_to(tmp_path)
+
+    assert validate_download_path(relative_base / "video.mp4", relative_base)
+    assert validate_download_path(relative_base / "video.mp4", base_dir)
+    assert not validate_download_path(relative_base / ".." / "video.mp4", relative_base)
+
+
+def test_download_path_relative_base_follows_working_directory(tmp_path, monkeypatch):
+    relative_base = Path("downloads")
+    for name in ("one", "two"):
+        (tmp_path / name / "downloads").mkdir(parents=True)
+
+    monkeypatch.chdir(tmp_path / "one")
+    assert validate_download_path(tmp_path / "one" / "downloads" / "sub" / "video.mp4", relative_base)
+
+    monkeypatch.chdir(tmp_path / "two")
+    assert not validate_download_path(tmp_path / "one" / "downloads" / "sub" / "video.mp4", relative_base)
+    assert validate_download_path(tmp_path / "two" / "downloads" / "sub" / "video.mp4", relative_base)
+
+
+# YouTube URLs
+
+@pytest.mark.parametrize("url", [
+    "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+    "http://youtube.com/watch?v=dQw4w9WgXcQ&t=42",
+    "youtube.com/watch?v=dQw4w9WgXcQ",
+    "https://www.youtube.com/embed/dQw4w9WgXcQ",
+    "https://www.youtube.com/v/dQw4w9WgXcQ",
+    "https://www.youtube.com/shorts/dQw4w9WgXcQ",
+    "https://youtu.be/dQw4w9WgXcQ?si=abc",
+])
+def test_extract_video_id(url):
+    assert extract_video_id(url) == "dQw4w9WgXcQ"
+
+
+@pytest.mark.parametrize("url", [
+    "",
+    "https://example.com/watch?v=dQw4w9WgXcQ",
+    "https://www.youtube.com/watch?v=short",
+    "https://www.youtube.com/watch?v=dQw4w9Wg$cQ",
+    "https://www.youtube.com/playlist?list=PL123",
+])
+def test_extract_video_id_rejects(url):
+    assert extract_video_id(url) is None
+
+
+def test_validate_youtube_url_normalizes():
+    assert validate_youtube_url("  https://youtu.be/dQw4w9WgXcQ ") == "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+
+
+@pytest.mark.parametrize("url", [None, "", "https://example.com/video"])
+def test_validate_youtube_url_invalid(url):
+    with pytest.raises(InvalidURLError) as exc_info:
+        validate_youtube_url(url)
+    assert exc_info.value.status_code == 400
+    assert exc_info.value.url == url
+
+
+# Filenames
+
+@pytest.mark.parametrize("filename, expected", [
+    ("video.mp4", "video.mp4"),
+    ("../../etc/passwd", "_.._etc_passwd"),
+    ('a<b>c:d"e/f\\g|h?i*j.mp4', "a_b_c_d_e_f_g_h_i_j.mp4"),
+    ("line\nbreak\x00.mp4", "line_break_.mp4"),
+    ("  .hidden. ", "hidden"),
+    ("...", "download"),
+    ("Видео/клип.mp4", "Видео_клип.mp4"),
+])
+def test_sanitize_filename(filename, expected):
+    assert sanitize_filename(filename) == expected
+
+
+def test_sanitize_filename_truncates_keeping_extension():
+    result = sanitize_filename("x" * 300 + ".mp4", max_length=50)
+    assert len(result) == 50
+    assert result.endswith(".mp4")
+
+
+# Other validators
+
+@pytest.mark.parametrize("quality, expected", [
+    ("best", True),
+    ("720p", True),
+    ("4320p", True),
+    ("p", False),
+    ("720", False),
+    ("hd720", False),
+])
+def test_validate_quality(quality, expected):
+    assert validate_quality(quality) is expected
+
+
+@pytest.mark.parametrize("format_id, expected", [
+    ("137", True),
+    ("137+140", True),
+    ("hls-1080p", True),
+    ("", False),
+    ("137;rm", False),
+    ("١٣٧", False),
+])
+def test_validate_format(format_id, expected):
+    assert validate_format(format_id) is expected
+
+
+@pytest.mark.parametrize("session_id, expected", [
+    ("123e4567-e89b-12d3-a456-426614174000", True),
+    ("short", False),
+    ("a" * 65, False),
+    ("abc_def_ghi", False),
+    (None, False),
+])
+def test_is_valid_session_id(session_id, expected):
+    assert is_valid_session_id(session_id) is expected
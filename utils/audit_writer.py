@@ -0,0 +1,156 @@
+"""
+Background batch writer for audit log entries that have no primary write.
+"""
+
+import asyncio
+from collections import deque
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import insert
+
+from database import SessionLocal
+from models.audit_log import AuditLog
+from utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Every queued row carries the same keys so the batch is a single executemany
+AUDIT_COLUMNS = (
+    'user_id', 'action', 'resource_type', 'resource_id',
+    'details', 'ip_address', 'user_agent', 'timestamp'
+)
+
+# Queue marker telling the writer to flush and exit
+_STOP = object()
+
+
+class AuditLogWriter:
+    """Collects audit rows in memory and inserts them in batches off the request path."""
+
+    def __init__(self, batch_size: int = 100, flush_interval: float = 0.5, max_pending: int = 1000):
+        """
+        Initialize audit log writer.
+
+        Args:
+            batch_size: Maximum rows per INSERT
+            flush_interval: Seconds to wait for more rows after the first one arrives
+            max_pending: Maximum rows held before start(); the oldest are dropped beyond it
+        """
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._stopped = False
+        
+        # Rows queued before the writer starts; handed over on start()
+        self._pending: deque = deque(maxlen=max_pending)
+        self._dropped = 0
+
+    async def start(self):
+        """Start the background writer task."""
+        self._queue = asyncio.Queue()
+        for row in self._pending:
+            self._queue.put_nowait(row)
+        self._pending.clear()
+        
+        if self._dropped:
+            logger.warning(f"Dropped {self._dropped} audit log entries queued before the writer started")
+            self._dropped = 0
+        
+        self._stopped = False
+        self._task = asyncio.create_task(self._run())
+        logger.info("Started audit log writer")
+
+    async def stop(self):
+        """Flush pending rows and stop the writer task."""
+        if self._task is None:
+            return
+
+        await self._queue.put(_STOP)
+        await self._task
+        
+        # Rows that arrived behind the stop marker
+        leftover = []
+        while not self._queue.empty():
+            leftover.append(self._queue.get_nowait())
+        if leftover:
+            await asyncio.get_running_loop().run_in_executor(None, self._write, leftover)
+        
+        self._task = None
+        self._queue = None
+        self._stopped = True
+        logger.info("Stopped audit log writer")
+
+    def enqueue(self, **values: Any):
+        """
+        Queue an audit log row.
+
+        The timestamp is taken now rather than at insert time. Rows queued
+        before the writer starts are buffered (up to max_pending) and written
+        once start() is called. After stop() (application shutdown) rows are
+        written immediately, since there is no writer left to hand them to.
+
+        Args:
+            **values: AuditLog column values
+        """
+        values.setdefault('timestamp', datetime.utcnow())
+        row = {column: values.get(column) for column in AUDIT_COLUMNS}
+
+        if self._queue is not None:
+            self._queue.put_nowait(row)
+        elif self._stopped:
+            self._write([row])
+        else:
+            if not self._pending:
+                logger.warning("Audit log writer is not running; buffering entries until it starts")
+            elif len(self._pending) == self._pending.maxlen:
+                self._dropped += 1
+            self._pending.append(row)
+
+    async def _run(self):
+        """Gather rows into batches and insert them in the default executor."""
+        loop = asyncio.get_running_loop()
+        stopping = False
+
+        while not stopping:
+            item = await self._queue.get()
+            if item is _STOP:
+                break
+
+            batch = [item]
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            await loop.run_in_executor(None, self._write, batch)
+
+    def _write(self, rows: List[Dict[str, Any]]):
+        """
+        Insert a batch of audit rows in one transaction.
+
+        Args:
+            rows: Audit rows keyed by AUDIT_COLUMNS
+        """
+        try:
+            with SessionLocal() as db:
+                db.execute(insert(AuditLog), rows)
+                db.commit()
+            logger.debug(f"Wrote {len(rows)} audit log entries")
+        except Exception as e:
+            logger.error(f"Failed to write {len(rows)} audit log entries: {e}")
+
+
+# Global audit writer instance
+audit_writer = AuditLogWriter()
@@ -0,0 +1,88 @@
+"""
+Application-wide scheduler for delayed deletion of served files.
+"""
+
+import asyncio
+import heapq
+import os
+import time
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class CleanupScheduler:
+    """Deletes files after a delay using one background task and a min-heap of deadlines."""
+
+    def __init__(self):
+        """Initialize cleanup scheduler."""
+        self._heap: List[Tuple[float, Path]] = []
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self):
+        """Start the background cleanup task."""
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+        logger.info("Started cleanup scheduler")
+
+    async def stop(self):
+        """Stop the cleanup task; pending files are left for the periodic cleanup."""
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        self._wakeup = None
+        logger.info(f"Stopped cleanup scheduler ({len(self._heap)} files pending)")
+
+    def schedule(self, path: Path, delay: float):
+        """
+        Delete a file after a delay.
+
+        Args:
+            path: File to delete
+            delay: Seconds to wait before deleting
+        """
+        deadline = time.monotonic() + delay
+        heapq.heappush(self._heap, (deadline, path))
+
+        # Wake the task if this file is now the next one due
+        if self._wakeup is not None and self._heap[0][1] is path:
+            self._wakeup.set()
+
+    async def _run(self):
+        """Sleep until the earliest deadline and delete every file that is due."""
+        while True:
+            timeout = self._heap[0][0] - time.monotonic() if self._heap else None
+            if timeout is None or timeout > 0:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            _, path = heapq.heappop(self._heap)
+            self._delete(path)
+
+    @staticmethod
+    def _delete(path: Path):
+        """Delete a file if it still exists."""
+        try:
+            if path.exists():
+                os.unlink(path)
+                logger.info(f"Auto-cleanup: Deleted file {path}")
+        except Exception as e:
+            logger.error(f"Auto-cleanup failed for {path}: {e}")
+
+
+# Global cleanup scheduler instance
+cleanup_scheduler = CleanupScheduler()
@@ -6,16 +6,22 @@ Custom exception classes for the YouTube Downloader application.
 class YouTubeDownloaderError(Exception):
     """Base exception class for all application errors."""
     
-    def __init__(self, message: str, status_code: int = 500):
-        self.message = message
-        self.status_code = status_code
+    # Defaults used when no message/status code is passed; subclasses override
+    DEFAULT_MESSAGE = "An unexpected error occurred"
+    DEFAULT_STATUS = 500
+    
+    def __init__(self, message: str = None, status_code: int = None):
+        self.message = self.DEFAULT_MESSAGE if message is None else message
+        self.status_code = self.DEFAULT_STATUS if status_code is None else status_code
         super().__init__(self.message)
 
 
 class DownloadError(YouTubeDownloaderError):
     """Raised when a download operation fails."""
     
-    def __init__(self, message: str, url: str = None, status_code: int = 500):
+    DEFAULT_MESSAGE = "Download failed"
+    
+    def __init__(self, message: str = None, url: str = None, status_code: int = None):
         self.url = url
         super().__init__(message, status_code)
 
@@ -23,14 +29,17 @@ class DownloadError(YouTubeDownloaderError):
 class AuthenticationError(YouTubeDownloaderError):
     """Raised when authentication fails."""
     
-    def __init__(self, message: str = "Authentication failed", status_code: int = 401):
-        super().__init__(message, status_code)
+    DEFAULT_MESSAGE = "Authentication failed"
+    DEFAULT_STATUS = 401
 
 
 class RateLimitError(YouTubeDownloaderError):
     """Raised when rate limit is exceeded."""
     
-    def __init__(self, message: str = "Rate limit exceeded", retry_after: int = None, status_code: int = 429):
+    DEFAULT_MESSAGE = "Rate limit exceeded"
+    DEFAULT_STATUS = 429
+    
+    def __init__(self, message: str = None, retry_after: int = None, status_code: int = None):
         self.retry_after = retry_after
         super().__init__(message, status_code)
 
@@ -38,14 +47,17 @@ class RateLimitError(YouTubeDownloaderError):
 class CaptchaRequiredError(YouTubeDownloaderError):
     """Raised when CAPTCHA verification is required."""
     
-    def __init__(self, message: str = "CAPTCHA verification required", status_code: int = 403):
-        super().__init__(message, status_code)
+    DEFAULT_MESSAGE = "CAPTCHA verification required"
+    DEFAULT_STATUS = 403
 
 
 class InvalidURLError(YouTubeDownloaderError):
     """Raised when an invalid YouTube URL is provided."""
     
-    def __init__(self, message: str = "Invalid YouTube URL", url: str = None, status_code: int = 400):
+    DEFAULT_MESSAGE = "Invalid YouTube URL"
+    DEFAULT_STATUS = 400
+    
+    def __init__(self, message: str = None, url: str = None, status_code: int = None):
         self.url = url
         super().__init__(message, status_code)
 
@@ -53,7 +65,10 @@ class InvalidURLError(YouTubeDownloaderError):
 class VideoUnavailableError(YouTubeDownloaderError):
     """Raised when a video is unavailable or private."""
     
-    def __init__(self, message: str = "Video unavailable", url: str = None, status_code: int = 404):
+    DEFAULT_MESSAGE = "Video unavailable"
+    DEFAULT_STATUS = 404
+    
+    def __init__(self, message: str = None, url: str = None, status_code: int = None):
         self.url = url
         super().__init__(message, status_code)
 
@@ -61,19 +76,17 @@ class VideoUnavailableError(YouTubeDownloaderError):
 class QueueFullError(YouTubeDownloaderError):
     """Raised when the download queue is full."""
     
-    def __init__(self, message: str = "Download queue is full", status_code: int = 503):
-        super().__init__(message, status_code)
+    DEFAULT_MESSAGE = "Download queue is full"
+    DEFAULT_STATUS = 503
 
 
 class EncryptionError(YouTubeDownloaderError):
     """Raised when encryption/decryption fails."""
     
-    def __init__(self, message: str = "Encryption/decryption failed", status_code: int = 500):
-        super().__init__(message, status_code)
+    DEFAULT_MESSAGE = "Encryption/decryption failed"
 
 
 class ConfigurationError(YouTubeDownloaderError):
     """Raised when configuration is invalid or missing."""
     
-    def __init__(self, message: str = "Configuration error", status_code: int = 500):
-        super().__init__(message, status_code)
+    DEFAULT_MESSAGE = "Configuration error"
@@ -0,0 +1,45 @@
+"""
+JSON serialization helpers.
+Uses orjson when available and falls back to the standard library.
+"""
+
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+    import json
+
+
+def dumps(obj: Any) -> str:
+    """
+    Serialize an object to a JSON string.
+    
+    Args:
+        obj: Object to serialize
+        
+    Returns:
+        JSON string
+    """
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj)
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse a JSON string.
+    
+    Args:
+        data: JSON string or bytes
+        
+    Returns:
+        Parsed object
+        
+    Raises:
+        ValueError: If data is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -0,0 +1,76 @@
+"""
+Keyset (cursor) pagination helpers for newest-first listings.
+"""
+
+from typing import List, Optional, Tuple
+
+from sqlalchemy.orm import Query
+
+# Response header carrying the cursor for the next page
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def keyset_page(
+    query: Query,
+    id_column,
+    limit: int,
+    cursor: Optional[int] = None,
+    skip: int = 0
+) -> Tuple[List, Optional[int]]:
+    """
+    Fetch one newest-first page of a query.
+
+    With a cursor the page starts with an index seek on the primary key
+    (WHERE id < cursor) instead of scanning and discarding ``skip`` rows.
+    Rows are ordered by id, which follows insertion order and therefore the
+    created_at/timestamp server defaults of these tables. ``skip`` is still
+    honoured when no cursor is given so offset-based clients keep working;
+    that path uses a deferred join so the OFFSET only walks primary keys.
+
+    Args:
+        query: Filtered ORM query
+        id_column: Primary key column to order and seek on
+        limit: Maximum number of rows to return
+        cursor: Id of the last row of the previous page
+        skip: Offset used when no cursor is given
+
+    Listings deliberately carry no total count: counting is a full scan on
+    large tables, while the next-page check costs one extra row.
+
+    Returns:
+        Tuple of (rows, next_cursor); next_cursor is None on the last page
+    """
+    if cursor is not None:
+        query = query.filter(id_column < cursor)
+    elif skip:
+        # Deferred join: walk the OFFSET over ids only, then fetch full rows
+        # for just the page instead of materialising every skipped row
+        page_ids = (
+            query.with_entities(id_column)
+            .order_by(id_column.desc())
+            .offset(skip)
+            .limit(limit + 1)
+            .subquery()
+        )
+        query = query.join(page_ids, id_column == page_ids.c.id)
+
+    # One extra row tells us whether another page exists; no COUNT(*) needed
+    rows = query.order_by(id_column.desc()).limit(limit + 1).all()
+    if len(rows) <= limit:
+        return rows, None
+
+    rows = rows[:limit]
+    return rows, rows[-1].id
+
+
+def cursor_headers(next_cursor: Optional[int]) -> dict:
+    """
+    Build response headers advertising the next page cursor.
+
+    Args:
+        next_cursor: Cursor returned by keyset_page
+
+    Returns:
+        Headers dict (empty on the last page)
+    """
+    return {NEXT_CURSOR_HEADER: str(next_cursor)} if next_cursor is not None else {}
@@ -2,21 +2,63 @@
 Input validation utilities for YouTube Downloader.
 """
 
+import os
 import re
+import string
+from functools import lru_cache
 from pathlib import Path
 from urllib.parse import urlparse, parse_qs
 from typing import Optional
 from .errors import InvalidURLError
 
+try:
+    import re2
+except ImportError:
+    re2 = None
 
-# YouTube URL patterns
-YOUTUBE_PATTERNS = [
-    r'(?:https?://)?(?:www\.)?youtube\.com/watch\?v=([a-zA-Z0-9_-]{11})',
-    r'(?:https?://)?(?:www\.)?youtube\.com/embed/([a-zA-Z0-9_-]{11})',
-    r'(?:https?://)?(?:www\.)?youtube\.com/v/([a-zA-Z0-9_-]{11})',
-    r'(?:https?://)?youtu\.be/([a-zA-Z0-9_-]{11})',
-    r'(?:https?://)?(?:www\.)?youtube\.com/shorts/([a-zA-Z0-9_-]{11})',
-]
+
+# YouTube URL pattern: watch, embed, v, shorts and youtu.be forms in one alternation
+_YOUTUBE_URL_REGEX = (
+    r'(?:https?://)?'
+    r'(?:(?:www\.)?youtube\.com/(?:watch\?v=|embed/|v/|shorts/)|youtu\.be/)'
+    r'([a-zA-Z0-9_-]{11})'
+)
+
+# Compiled with RE2 when available for linear-time matching of untrusted URLs;
+# otherwise with re (URLs and video IDs are ASCII, so Unicode matching is switched off)
+YOUTUBE_URL_PATTERN = (
+    re2.compile(_YOUTUBE_URL_REGEX) if re2 is not None
+    else re.compile(_YOUTUBE_URL_REGEX, re.ASCII)
+)
+
+# Canonical watch URL prefix and video ID alphabet, for the regex-free fast path
+WATCH_URL_PREFIX = 'youtube.com/watch?v='
+VIDEO_ID_CHARS = frozenset(string.ascii_letters + string.digits + '_-')
+
+# Filename characters replaced by "_": path separators, characters Windows forbids
+# and control characters
+_UNSAFE_CHARS = '<>:"/\\|?*' + ''.join(map(chr, range(0x20)))
+UNSAFE_FILENAME_CHARS = str.maketrans(_UNSAFE_CHARS, '_' * len(_UNSAFE_CHARS))
+UNSAFE_FILENAME_BYTES = bytes.maketrans(_UNSAFE_CHARS.encode('ascii'), b'_' * len(_UNSAFE_CHARS))
+
+# Named quality presets accepted besides "<height>p"
+VALID_QUALITIES = frozenset({
+    "best", "worst",
+    "2160p", "1440p", "1080p", "720p", "480p", "360p", "240p", "144p",
+    "bestaudio", "worstaudio"
+})
+
+# Characters allowed in yt-dlp format IDs ("137+140", "hls-1080p")
+FORMAT_ID_CHARS = frozenset(string.ascii_letters + string.digits + '_+-')
+
+# Characters allowed in session IDs (UUID-style: alphanumerics and hyphens)
+SESSION_ID_CHARS = frozenset(string.ascii_letters + string.digits + '-')
+
+VALID_CODECS = frozenset({
+    "h264", "h265", "vp9", "av1",  # Video codecs
+    "aac", "opus", "mp3", "vorbis",  # Audio codecs
+    "any"  # Any codec
+})
 
 
 def validate_youtube_url(url: str) -> str:
@@ -37,14 +79,7 @@ def validate_youtube_url(url: str) -> str:
     
     url = url.strip()
     
-    # Try to match against YouTube patterns
-    video_id = None
-    for pattern in YOUTUBE_PATTERNS:
-        match = re.search(pattern, url)
-        if match:
-            video_id = match.group(1)
-            break
-    
+    video_id = extract_video_id(url)
     if not video_id:
         raise InvalidURLError("Not a valid YouTube URL", url=url)
     
@@ -52,21 +87,35 @@ def validate_youtube_url(url: str) -> str:
     return f"https://www.youtube.com/watch?v={video_id}"
 
 
+@lru_cache(maxsize=2048)
 def extract_video_id(url: str) -> Optional[str]:
     """
     Extract video ID from YouTube URL.
     
+    Results are memoized: the same URL is validated at info, enqueue and
+    download time.
+    
     Args:
         url: YouTube URL
         
     Returns:
         Video ID or None if not found
     """
-    for pattern in YOUTUBE_PATTERNS:
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1)
-    return None
+    # Cheap substring test rejects most garbage before any matching
+    if 'youtu' not in url:
+        return None
+    
+    # Fast path for the dominant youtube.com/watch?v=<id> form
+    start = url.find(WATCH_URL_PREFIX)
+    if start >= 0:
+        start += len(WATCH_URL_PREFIX)
+        candidate = url[start:start + 11]
+        if len(candidate) == 11 and VIDEO_ID_CHARS.issuperset(candidate):
+            return candidate
+    
+    # Other forms (embed, v, shorts, youtu.be)
+    match = YOUTUBE_URL_PATTERN.search(url)
+    return match.group(1) if match else None
 
 
 def sanitize_filename(filename: str, max_length: int = 200) -> str:
@@ -80,9 +129,12 @@ def sanitize_filename(filename: str, max_length: int = 200) -> str:
     Returns:
         Sanitized filename
     """
-    # Remove path separators and other dangerous characters
-    unsafe_chars = r'[<>:"/\\|?*\x00-\x1f]'
-    filename = re.sub(unsafe_chars, '_', filename)
+    # Remove path separators and other dangerous characters; ASCII names (the
+    # common case) go through a 256-byte table in a single C pass
+    if filename.isascii():
+        filename = filename.encode('ascii').translate(UNSAFE_FILENAME_BYTES).decode('ascii')
+    else:
+        filename = filename.translate(UNSAFE_FILENAME_CHARS)
     
     # Remove leading/trailing dots and spaces
     filename = filename.strip('. ')
@@ -91,13 +143,13 @@ def sanitize_filename(filename: str, max_length: int = 200) -> str:
     if not filename:
         filename = "download"
     
-    # Truncate to max length (preserve extension)
-    if len(filename) > max_length:
-        name, ext = filename.rsplit('.', 1) if '.' in filename else (filename, '')
-        available_length = max_length - len(ext) - 1 if ext else max_length
-        filename = name[:available_length] + ('.' + ext if ext else '')
+    # Common case: already short enough
+    if len(filename) <= max_length:
+        return filename
     
-    return filename
+    # Truncate to max length (preserve extension)
+    name, ext = os.path.splitext(filename)
+    return name[:max_length - len(ext)] + ext
 
 
 def validate_format(format_id: str) -> bool:
@@ -113,8 +165,12 @@ def validate_format(format_id: str) -> bool:
     if not format_id or not isinstance(format_id, str):
         return False
     
+    # Most format IDs are plain ASCII alphanumerics ("137", "hls1080")
+    if format_id.isascii() and format_id.isalnum():
+        return True
+    
     # Allow alphanumeric, dash, underscore, and plus
-    return bool(re.match(r'^[a-zA-Z0-9_+-]+$', format_id))
+    return FORMAT_ID_CHARS.issuperset(format_id)
 
 
 def validate_quality(quality: str) -> bool:
@@ -127,18 +183,31 @@ def validate_quality(quality: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    valid_qualities = [
-        "best", "worst",
-        "2160p", "1440p", "1080p", "720p", "480p", "360p", "240p", "144p",
-        "bestaudio", "worstaudio"
-    ]
-    return quality in valid_qualities or bool(re.match(r'^\d+p$', quality))
+    if quality in VALID_QUALITIES:
+        return True
+    
+    # Any "<height>p", e.g. "4320p"
+    return len(quality) > 1 and quality.endswith('p') and quality[:-1].isdecimal()
+
+
+@lru_cache(maxsize=16)
+def _resolve_base_dir(base_dir: Path) -> Path:
+    """
+    Resolve an absolute base directory once; download directories are fixed
+    for the process. Relative bases are not cached since they depend on the
+    working directory.
+    """
+    return base_dir.resolve()
 
 
 def validate_download_path(path: Path, base_dir: Path) -> bool:
     """
     Validate that download path is within base directory (prevent path traversal).
     
+    Paths built as ``base_dir / name`` under an absolute base_dir are
+    accepted without resolving, unless the name is a symlink; anything else
+    (relative paths, nested paths, "..") is checked by resolving both paths.
+    
     Args:
         path: Path to validate
         base_dir: Base directory that path must be within
@@ -146,10 +215,20 @@ def validate_download_path(path: Path, base_dir: Path) -> bool:
     Returns:
         True if valid, False otherwise
     """
+    # Fast path: direct child of an absolute base_dir that is not a symlink
+    # (the usual base_dir / sanitized name); one lstat instead of two resolves
+    if (
+        base_dir.is_absolute()
+        and path.parent == base_dir
+        and path.name != '..'
+        and not os.path.islink(path)
+    ):
+        return True
+    
     try:
         # Resolve to absolute paths
         abs_path = path.resolve()
-        abs_base = base_dir.resolve()
+        abs_base = _resolve_base_dir(base_dir) if base_dir.is_absolute() else base_dir.resolve()
         
         # Check if path is within base directory
         return abs_path.is_relative_to(abs_base)
@@ -171,7 +250,7 @@ def is_valid_session_id(session_id: str) -> bool:
         return False
     
     # Session ID should be alphanumeric and hyphen only (UUID format)
-    return bool(re.match(r'^[a-zA-Z0-9-]{8,64}$', session_id))
+    return 8 <= len(session_id) <= 64 and SESSION_ID_CHARS.issuperset(session_id)
 
 
 def validate_codec(codec: str) -> bool:
@@ -184,9 +263,4 @@ def validate_codec(codec: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    valid_codecs = [
-        "h264", "h265", "vp9", "av1",  # Video codecs
-        "aac", "opus", "mp3", "vorbis",  # Audio codecs
-        "any"  # Any codec
-    ]
-    return codec.lower() in valid_codecs
+    return codec.lower() in VALID_CODECS